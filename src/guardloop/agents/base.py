@@ -1,9 +1,11 @@
 """Base agent classes and data structures"""
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Pattern, Tuple
 
 from guardloop.core.failure_detector import DetectedFailure
 from guardloop.core.parser import ParsedResponse
@@ -89,8 +91,22 @@ class BaseAgent(ABC):
         Returns:
             True if any keyword found
         """
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
+        if not keywords:
+            return False
+        return self._keyword_pattern(tuple(keywords)).search(text) is not None
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern[str]:
+        """Compile a case-insensitive alternation matching any keyword
+
+        Args:
+            keywords: Keywords to match literally
+
+        Returns:
+            Compiled pattern, cached per keyword set
+        """
+        return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
 
     def _count_code_blocks(self, parsed: Optional[ParsedResponse]) -> int:
         """Count code blocks in parsed response
@@ -1,7 +1,9 @@
 """Optimize agent chains based on task complexity."""
 
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Sequence, Tuple
 
 import structlog
 
@@ -21,110 +23,118 @@ class AgentChainOptimizer:
     """Select minimal agent chain for task."""
 
     # Task → Agent Chain Mapping
-    TASK_AGENT_CHAINS = {
-        # Simple tasks - single agent
-        "fix_typo": ["standards_oracle"],
-        "update_docs": ["documentation_codifier"],
-        "format_code": ["standards_oracle"],
-        # Medium tasks - focused chain
-        "implement_function": ["cold_blooded_architect", "ruthless_coder", "ruthless_tester"],
-        "add_tests": ["ruthless_tester"],
-        "fix_bug": ["support_debug_hunter", "ruthless_tester"],
-        "refactor": ["cold_blooded_architect", "ruthless_coder", "ruthless_tester"],
-        # Complex tasks - extended chain
-        "implement_feature": [
-            "business_analyst",
-            "cold_blooded_architect",
-            "ruthless_coder",
-            "ruthless_tester",
-            "merciless_evaluator",
-        ],
-        "implement_auth": [
-            "cold_blooded_architect",
-            "secops_engineer",
-            "ruthless_coder",
-            "ruthless_tester",
-            "merciless_evaluator",
-        ],
-        "database_design": [
-            "cold_blooded_architect",
-            "dba",
-            "ruthless_coder",
-            "ruthless_tester",
-        ],
-        # Critical tasks - full chain + compliance
-        "build_auth_system": [
-            "business_analyst",
-            "cold_blooded_architect",
-            "secops_engineer",
-            "dba",
-            "ruthless_coder",
-            "ruthless_tester",
-            "sre_ops",
-            "standards_oracle",
-            "merciless_evaluator",
-        ],
-        "implement_payment": [
-            "business_analyst",
-            "cold_blooded_architect",
-            "secops_engineer",
-            "dba",
-            "ruthless_coder",
-            "ruthless_tester",
-            "standards_oracle",
-            "sre_ops",
-            "merciless_evaluator",
-        ],
-        "compliance_feature": [
-            "business_analyst",
-            "cold_blooded_architect",
-            "secops_engineer",
-            "ruthless_coder",
-            "ruthless_tester",
-            "standards_oracle",
-            "merciless_evaluator",
-            "documentation_codifier",
-        ],
-        # UI/UX tasks
-        "implement_ui": [
-            "ux_ui_designer",
-            "ruthless_coder",
-            "ruthless_tester",
-        ],
-        "improve_accessibility": [
-            "ux_ui_designer",
-            "ruthless_coder",
-            "ruthless_tester",
-        ],
-        # API tasks
-        "implement_api": [
-            "cold_blooded_architect",
-            "ruthless_coder",
-            "ruthless_tester",
-        ],
-        "api_security": [
-            "cold_blooded_architect",
-            "secops_engineer",
-            "ruthless_coder",
-            "ruthless_tester",
-        ],
-    }
+    # Frozen at class load: resolved chains are memoized, so the table must not change
+    TASK_AGENT_CHAINS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+        {
+            # Simple tasks - single agent
+            "fix_typo": ("standards_oracle",),
+            "update_docs": ("documentation_codifier",),
+            "format_code": ("standards_oracle",),
+            # Medium tasks - focused chain
+            "implement_function": ("cold_blooded_architect", "ruthless_coder", "ruthless_tester"),
+            "add_tests": ("ruthless_tester",),
+            "fix_bug": ("support_debug_hunter", "ruthless_tester"),
+            "refactor": ("cold_blooded_architect", "ruthless_coder", "ruthless_tester"),
+            # Complex tasks - extended chain
+            "implement_feature": (
+                "business_analyst",
+                "cold_blooded_architect",
+                "ruthless_coder",
+                "ruthless_tester",
+                "merciless_evaluator",
+            ),
+            "implement_auth": (
+                "cold_blooded_architect",
+                "secops_engineer",
+                "ruthless_coder",
+                "ruthless_tester",
+                "merciless_evaluator",
+            ),
+            "database_design": (
+                "cold_blooded_architect",
+                "dba",
+                "ruthless_coder",
+                "ruthless_tester",
+            ),
+            # Critical tasks - full chain + compliance
+            "build_auth_system": (
+                "business_analyst",
+                "cold_blooded_architect",
+                "secops_engineer",
+                "dba",
+                "ruthless_coder",
+                "ruthless_tester",
+                "sre_ops",
+                "standards_oracle",
+                "merciless_evaluator",
+            ),
+            "implement_payment": (
+                "business_analyst",
+                "cold_blooded_architect",
+                "secops_engineer",
+                "dba",
+                "ruthless_coder",
+                "ruthless_tester",
+                "standards_oracle",
+                "sre_ops",
+                "merciless_evaluator",
+            ),
+            "compliance_feature": (
+                "business_analyst",
+                "cold_blooded_architect",
+                "secops_engineer",
+                "ruthless_coder",
+                "ruthless_tester",
+                "standards_oracle",
+                "merciless_evaluator",
+                "documentation_codifier",
+            ),
+            # UI/UX tasks
+            "implement_ui": (
+                "ux_ui_designer",
+                "ruthless_coder",
+                "ruthless_tester",
+            ),
+            "improve_accessibility": (
+                "ux_ui_designer",
+                "ruthless_coder",
+                "ruthless_tester",
+            ),
+            # API tasks
+            "implement_api": (
+                "cold_blooded_architect",
+                "ruthless_coder",
+                "ruthless_tester",
+            ),
+            "api_security": (
+                "cold_blooded_architect",
+                "secops_engineer",
+                "ruthless_coder",
+                "ruthless_tester",
+            ),
+        }
+    )
 
     # Agent name normalization mapping (old → new)
-    AGENT_NAME_MAP = {
-        "architect": "cold_blooded_architect",
-        "coder": "ruthless_coder",
-        "tester": "ruthless_tester",
-        "debug_hunter": "support_debug_hunter",
-        "secops": "secops_engineer",
-        "sre": "sre_ops",
-        "evaluator": "merciless_evaluator",
-        "documentation": "documentation_codifier",
-        "ux_designer": "ux_ui_designer",
-    }
+    AGENT_NAME_MAP: Mapping[str, str] = MappingProxyType(
+        {
+            "architect": "cold_blooded_architect",
+            "coder": "ruthless_coder",
+            "tester": "ruthless_tester",
+            "debug_hunter": "support_debug_hunter",
+            "secops": "secops_engineer",
+            "sre": "sre_ops",
+            "evaluator": "merciless_evaluator",
+            "documentation": "documentation_codifier",
+            "ux_designer": "ux_ui_designer",
+        }
+    )
 
     def __init__(self):
         """Initialize chain optimizer"""
+        # Chain tables are frozen, so resolved chains are memoized per instance.
+        # _build_chain is a classmethod: the cache holds the class, not self.
+        self._select_chain_cached = lru_cache(maxsize=256)(type(self)._build_chain)
         logger.debug("AgentChainOptimizer initialized")
 
     def select_chain(
@@ -154,18 +164,47 @@ class AgentChainOptimizer:
             )
             return [normalized_agent]
 
+        unique_chain = list(self._select_chain_cached(task_type, mode))
+
+        logger.info(
+            "Agent chain selected",
+            task_type=task_type,
+            mode=mode,
+            chain_length=len(unique_chain),
+            complexity=self.get_complexity(task_type).value,
+        )
+
+        return unique_chain
+
+    @classmethod
+    def _build_chain(cls, task_type: str, mode: str) -> Tuple[str, ...]:
+        """Resolve the normalized, de-duplicated chain for a task.
+
+        Args:
+            task_type: Type of task to perform
+            mode: Operating mode (standard or strict)
+
+        Returns:
+            Tuple of agent names to execute in order
+        """
         # Get base chain for task
-        chain = self.TASK_AGENT_CHAINS.get(
-            task_type,
-            ["cold_blooded_architect", "ruthless_coder", "ruthless_tester"],  # Default medium chain
+        chain: List[str] = list(
+            cls.TASK_AGENT_CHAINS.get(
+                task_type,
+                (
+                    "cold_blooded_architect",
+                    "ruthless_coder",
+                    "ruthless_tester",
+                ),  # Default medium chain
+            )
         )
 
         # Strict mode: add compliance agents
         if mode == "strict":
-            chain = self._add_strict_agents(chain, task_type)
+            chain = cls._add_strict_agents(chain, task_type)
 
         # Normalize all agent names
-        chain = [self._normalize_agent_name(agent) for agent in chain]
+        chain = [cls._normalize_agent_name(agent) for agent in chain]
 
         # Remove duplicates while preserving order
         seen = set()
@@ -175,17 +214,10 @@ class AgentChainOptimizer:
                 seen.add(agent)
                 unique_chain.append(agent)
 
-        logger.info(
-            "Agent chain selected",
-            task_type=task_type,
-            mode=mode,
-            chain_length=len(unique_chain),
-            complexity=self.get_complexity(task_type).value,
-        )
-
-        return unique_chain
+        return tuple(unique_chain)
 
-    def _add_strict_agents(self, chain: List[str], task_type: str) -> List[str]:
+    @classmethod
+    def _add_strict_agents(cls, chain: Sequence[str], task_type: str) -> List[str]:
         """Add agents for strict mode.
 
         Args:
@@ -195,7 +227,7 @@ class AgentChainOptimizer:
         Returns:
             Enhanced chain with strict mode agents
         """
-        strict_chain = chain.copy()
+        strict_chain = list(chain)
 
         # Always add security check in strict mode
         if "secops_engineer" not in strict_chain and "secops" not in strict_chain:
@@ -238,7 +270,7 @@ class AgentChainOptimizer:
         """
         chain_length = len(
             self.TASK_AGENT_CHAINS.get(
-                task_type, ["cold_blooded_architect", "ruthless_coder", "ruthless_tester"]
+                task_type, ("cold_blooded_architect", "ruthless_coder", "ruthless_tester")
             )
         )
 
@@ -260,7 +292,8 @@ class AgentChainOptimizer:
 
         return complexity
 
-    def _normalize_agent_name(self, agent_name: str) -> str:
+    @classmethod
+    def _normalize_agent_name(cls, agent_name: str) -> str:
         """Normalize agent name to standard format.
 
         Args:
@@ -273,8 +306,8 @@ class AgentChainOptimizer:
         normalized = agent_name.lower().replace("-", "_")
 
         # Apply mapping if exists
-        if normalized in self.AGENT_NAME_MAP:
-            return self.AGENT_NAME_MAP[normalized]
+        if normalized in cls.AGENT_NAME_MAP:
+            return cls.AGENT_NAME_MAP[normalized]
 
         return normalized
 
@@ -53,7 +53,7 @@ class DebugHunterAgent(BaseAgent):
     def _has_regression_tests(self, context):
         if context.parsed_response:
             return self._contains_keywords(
-                " ".join([b.code for b in context.parsed_response.code_blocks]),
+                context.parsed_response.joined_code,
                 ["test_", "it(", "regression", "reproduce"],
             )
         return False
@@ -61,7 +61,7 @@ class DebugHunterAgent(BaseAgent):
     def _has_debug_logging(self, context):
         if context.parsed_response:
             return self._contains_keywords(
-                " ".join([b.code for b in context.parsed_response.code_blocks]),
+                context.parsed_response.joined_code,
                 ["logger", "logging", "log.", "console.log", "print("],
             )
         return False
@@ -43,13 +43,11 @@ class StandardsOracleAgent(BaseAgent):
 
     def _follows_naming_conventions(self, context):
         # Basic check - assumes reasonable naming if no obvious violations
-        if context.parsed_response and context.parsed_response.code_blocks:
-            for block in context.parsed_response.code_blocks:
-                # Check for bad patterns
-                if self._contains_keywords(
-                    block.content, ["var ", "temp1", "data2", "foo", "test1"]
-                ):
-                    return False
+        if context.parsed_response:
+            # Check for bad patterns across all code blocks at once
+            return not self._contains_keywords(
+                context.parsed_response.joined_code, ["var ", "temp1", "data2", "foo", "test1"]
+            )
         return True
 
     def _has_consistent_style(self, context):
@@ -1,6 +1,6 @@
 """Context Manager for building enhanced prompts with guardrails"""
 
-from datetime import datetime, timedelta
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -17,7 +17,8 @@ class GuardrailCache:
 
     def __init__(self, ttl_seconds: int = 300):  # 5 minutes default
         self.ttl_seconds = ttl_seconds
-        self._cache: Dict[str, Tuple[str, datetime]] = {}
+        # Monotonic timestamps: wall-clock jumps can't expire or pin entries
+        self._cache: Dict[str, Tuple[str, float]] = {}
 
     def get(self, key: str) -> Optional[str]:
         """Get cached content if not expired"""
@@ -25,7 +26,7 @@ class GuardrailCache:
             return None
 
         content, timestamp = self._cache[key]
-        if datetime.now() - timestamp > timedelta(seconds=self.ttl_seconds):
+        if time.monotonic() - timestamp > self.ttl_seconds:
             del self._cache[key]
             return None
 
@@ -33,7 +34,7 @@ class GuardrailCache:
 
     def set(self, key: str, content: str) -> None:
         """Cache content with timestamp"""
-        self._cache[key] = (content, datetime.now())
+        self._cache[key] = (content, time.monotonic())
 
     def clear(self) -> None:
         """Clear all cached content"""
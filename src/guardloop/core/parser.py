@@ -2,14 +2,14 @@
 
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CodeBlock:
     """Represents a code block from AI output"""
 
@@ -20,16 +20,25 @@ class CodeBlock:
     is_inline: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedResponse:
     """Structured data extracted from AI response"""
 
-    code_blocks: List[CodeBlock] = field(default_factory=list)
+    # Accepts any sequence; stored as a tuple so joined_code cannot drift from it
+    code_blocks: Sequence[CodeBlock] = ()
     file_paths: List[str] = field(default_factory=list)
     commands: List[str] = field(default_factory=list)
     explanations: List[str] = field(default_factory=list)
     test_coverage: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Contents of all code blocks, joined once for agent keyword scans
+    joined_code: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "code_blocks", tuple(self.code_blocks))
+        object.__setattr__(
+            self, "joined_code", "\n".join(block.content for block in self.code_blocks)
+        )
 
 
 class ResponseParser:
@@ -101,15 +110,15 @@ class ResponseParser:
         """
         logger.info("Parsing AI response", text_length=len(text))
 
-        response = ParsedResponse()
-
         # Extract all components
-        response.code_blocks = self.extract_code_blocks(text)
-        response.file_paths = self.extract_file_paths(text)
-        response.commands = self.extract_commands(text)
-        response.explanations = self.extract_explanations(text)
-        response.test_coverage = self.extract_test_coverage(text)
-        response.metadata = self._extract_metadata(text)
+        response = ParsedResponse(
+            code_blocks=self.extract_code_blocks(text),
+            file_paths=self.extract_file_paths(text),
+            commands=self.extract_commands(text),
+            explanations=self.extract_explanations(text),
+            test_coverage=self.extract_test_coverage(text),
+            metadata=self._extract_metadata(text),
+        )
 
         logger.info(
             "Response parsed",
@@ -1,20 +1,59 @@
 """Shared test fixtures for guardrail tests"""
 
+import asyncio
+import logging
+
 import pytest
 from pathlib import Path
+from unittest.mock import AsyncMock
 from typing import List
 
+from guardloop.agents.base import AgentDecision, BaseAgent
+from guardloop.agents.chain_optimizer import AgentChainOptimizer
+from guardloop.agents.orchestrator import OrchestratorAgent
 from guardloop.core.daemon import GuardrailDaemon
-from guardloop.core.parser import ParsedResponse, CodeBlock
 from guardloop.core.validator import Violation
-from guardloop.core.failure_detector import DetectedFailure
 from guardloop.utils.config import Config, DatabaseConfig, LoggingConfig
-from datetime import datetime
 
+try:
+    import uvloop
+except ImportError:  # optional: stdlib asyncio loop is used instead
+    uvloop = None
 
-@pytest.fixture
-def config():
-    """Test configuration with in-memory database"""
+# Normalized agent names that orchestrate() looks up, across every task chain
+CHAIN_AGENTS = tuple(
+    sorted({name for chain in AgentChainOptimizer.TASK_AGENT_CHAINS.values() for name in chain})
+)
+
+# First agent of the strict implement_function chain; it rejects in
+# mocked_strict_orchestrator
+_STRICT_REJECTING_AGENT = "cold_blooded_architect"
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed"""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(autouse=True)
+def _restore_root_logging():
+    """Detach root log handlers added by configure_logging() during a test"""
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    level = root_logger.level
+    yield
+    for handler in root_logger.handlers[:]:
+        if handler not in handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+    root_logger.setLevel(level)
+
+
+@pytest.fixture(scope="session")
+def _base_config():
+    """Validated base configuration, built once per session"""
     return Config(
         mode="standard",
         database=DatabaseConfig(path=":memory:"),
@@ -23,13 +62,57 @@ def config():
 
 
 @pytest.fixture
-def strict_config():
+def config(_base_config):
+    """Test configuration with in-memory database"""
+    # Deep copy: tests toggle nested fields such as config.features.*
+    return _base_config.model_copy(deep=True)
+
+
+@pytest.fixture
+def strict_config(_base_config):
     """Strict mode configuration"""
-    return Config(
-        mode="strict",
-        database=DatabaseConfig(path=":memory:"),
-        logging=LoggingConfig(level="DEBUG"),
-    )
+    return _base_config.model_copy(update={"mode": "strict"}, deep=True)
+
+
+@pytest.fixture(scope="session")
+def loaded_orchestrator(_base_config):
+    """Orchestrator with all agents loaded, built once per session"""
+    orchestrator = OrchestratorAgent(_base_config)
+    asyncio.run(orchestrator.load_agents())
+    return orchestrator
+
+
+@pytest.fixture
+def mocked_orchestrator(_base_config):
+    """Orchestrator whose chain agents approve with canned decisions
+
+    Mocks are registered under the normalized names the chain optimizer emits
+    and are rebuilt per test so call history starts empty.
+    """
+    orchestrator = OrchestratorAgent(_base_config)
+    for name in CHAIN_AGENTS:
+        agent = AsyncMock(spec=BaseAgent)
+        agent.evaluate.return_value = AgentDecision(agent_name=name, approved=True, reason="ok")
+        orchestrator.register_agent(name, agent)
+    return orchestrator
+
+
+@pytest.fixture
+def mocked_strict_orchestrator(strict_config):
+    """Strict-mode orchestrator whose chain agents approve, except the architect
+
+    Mocks are registered under the normalized names the chain optimizer emits
+    and are rebuilt per test so call history starts empty.
+    """
+    orchestrator = OrchestratorAgent(strict_config)
+    for name in orchestrator.chain_optimizer.select_chain("implement_function", mode="strict"):
+        agent = AsyncMock(spec=BaseAgent)
+        approved = name != _STRICT_REJECTING_AGENT
+        agent.evaluate.return_value = AgentDecision(
+            agent_name=name, approved=approved, reason="ok" if approved else "rejected"
+        )
+        orchestrator.register_agent(name, agent)
+    return orchestrator
 
 
 @pytest.fixture
@@ -38,7 +121,7 @@ def daemon(config):
     return GuardrailDaemon(config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ai_response():
     """Sample AI response with code and tests"""
     return """
@@ -84,49 +167,6 @@ Error handling: Comprehensive with logging
 """
 
 
-@pytest.fixture
-def sample_parsed_response():
-    """Sample parsed response object"""
-    code_blocks = [
-        CodeBlock(
-            language="python",
-            content="""
-def login(username: str, password: str) -> bool:
-    try:
-        user = db.get_user(username)
-        if not user or not verify_password(password, user.password_hash):
-            raise AuthenticationError("Invalid credentials")
-        return True
-    except Exception as e:
-        logger.error(f"Authentication failed: {e}")
-        raise
-            """,
-            file_path="auth.py",
-        ),
-        CodeBlock(
-            language="python",
-            content="""
-def test_login_success():
-    assert login("user", "pass") == True
-
-def test_login_failure():
-    with pytest.raises(AuthenticationError):
-        login("invalid", "wrong")
-            """,
-            file_path="test_auth.py",
-        ),
-    ]
-
-    return ParsedResponse(
-        code_blocks=code_blocks,
-        file_paths=["auth.py", "test_auth.py"],
-        commands=[],
-        explanations=["Implementation with authentication and tests"],
-        test_coverage=100.0,
-        metadata={"security": "MFA + Azure AD"},
-    )
-
-
 @pytest.fixture
 def sample_violations():
     """Sample violations list"""
@@ -152,31 +192,6 @@ def sample_violations():
     ]
 
 
-@pytest.fixture
-def sample_failures():
-    """Sample failures list"""
-    return [
-        DetectedFailure(
-            category="JWT/Auth",
-            pattern="authentication failed",
-            timestamp=datetime.now(),
-            severity="high",
-            context="User authentication",
-            suggestion="Check token validation logic",
-            tool="claude",
-        ),
-        DetectedFailure(
-            category="File Overwrite",
-            pattern="large code block",
-            timestamp=datetime.now(),
-            severity="medium",
-            context="Full file rewrite detected",
-            suggestion="Use incremental edits instead",
-            tool="claude",
-        ),
-    ]
-
-
 @pytest.fixture
 def temp_guardrail_dir(tmp_path):
     """Temporary guardrail directory for tests"""
@@ -247,7 +262,7 @@ def sample_agent_instructions(temp_guardrail_dir):
 
 
 @pytest.fixture
-def mock_db_session(monkeypatch):
+def mock_db_session():
     """Mock database session for testing"""
 
     class MockSession:
@@ -1,10 +1,28 @@
 """Performance tests for optimization impact measurement."""
 
+import asyncio
 import pytest
 import time
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
+from operator import itemgetter
 from typing import Dict, Any
 
+# Legacy guardrail baseline blocks, built once per process
+_X400 = "x" * 400
+_Y600 = "y" * 600
+_Z500 = "z" * 500
+_CORE_BLOCK = f"## Rule: {_X400}\nDetails: {_Y600}\nExample: {_Z500}\n\n"
+_SECURITY_BLOCK = f"## Security: {_X400}\nExample: {_Y600}\nCode: {_Z500}\n\n"
+_TESTING_BLOCK = f"## Test: {_X400}\nCoverage: {_Y600}\nAssert: {_Z500}\n\n"
+_AUTH_BLOCK = f"## Auth pattern: {_X400}\nImplementation: {_Y600}\n\n"
+_DB_BLOCK = f"## DB rule: {_X400}\nSchema: {_Y600}\n\n"
+_API_BLOCK = f"## API guideline: {_X400}\nEndpoint: {_Y600}\n\n"
+
+# Budget categories returned by ContextBudgetManager.allocate_budget
+_ALLOCATION_KEYS = ("agents", "specialized", "core", "learned")
+_get_allocation = itemgetter(*_ALLOCATION_KEYS)
+
 
 def count_tokens(text: str, chars_per_token: int = 4) -> int:
     """Estimate token count from text.
@@ -39,11 +57,61 @@ def test_config():
     return config
 
 
+@pytest.fixture(scope="module")
+def classifier():
+    """Shared task classifier (stateless, safe to reuse across cases)."""
+    from guardloop.core.task_classifier import TaskClassifier
+
+    return TaskClassifier()
+
+
+@pytest.fixture(scope="module")
+def optimizer():
+    """Shared agent chain optimizer (stateless, safe to reuse across cases)."""
+    from guardloop.agents.chain_optimizer import AgentChainOptimizer
+
+    return AgentChainOptimizer()
+
+
+@pytest.fixture(scope="session")
+def mock_guardrails():
+    """100 lightweight guardrail stand-ins, built once per session."""
+    return [
+        SimpleNamespace(
+            id=i,
+            rule_text=f"Security rule {i}: Validate input and prevent injection",
+            rule_metadata={},
+        )
+        for i in range(100)
+    ]
+
+
+@pytest.fixture
+def semantic_matcher():
+    """Fresh semantic matcher (skips if optional deps are missing)."""
+    pytest.importorskip("numpy")
+    pytest.importorskip("sentence_transformers")
+    from guardloop.core.semantic_matcher import SemanticGuardrailMatcher
+
+    return SemanticGuardrailMatcher()
+
+
+@pytest.fixture(scope="session")
+def indexed_semantic_matcher(mock_guardrails):
+    """Semantic matcher with mock_guardrails indexed once per session."""
+    pytest.importorskip("numpy")
+    pytest.importorskip("sentence_transformers")
+    from guardloop.core.semantic_matcher import SemanticGuardrailMatcher
+
+    matcher = SemanticGuardrailMatcher()
+    asyncio.run(matcher.index_guardrails(mock_guardrails))
+    return matcher
+
+
 class TestContextSizeReduction:
     """Test context size optimization"""
 
-    @pytest.mark.asyncio
-    async def test_smart_selection_reduces_context(self, test_config):
+    def test_smart_selection_reduces_context(self, test_config):
         """Verify smart selection reduces context size significantly."""
         from guardloop.core.context_manager import ContextManager
 
@@ -53,54 +121,12 @@ class TestContextSizeReduction:
         # Old: Would load all 3 main files + all agents (~24K tokens total)
         # Each guardrail file is ~500-1000 lines of markdown with detailed rules and examples
         old_guardrails = [
-            "# Core Always Guardrails\n"
-            + (
-                "## Rule: "
-                + "x" * 400
-                + "\n"
-                + "Details: "
-                + "y" * 600
-                + "\n"
-                + "Example: "
-                + "z" * 500
-                + "\n\n"
-            )
-            * 15,  # ~22K chars
-            "# Security Baseline\n"
-            + (
-                "## Security: "
-                + "x" * 400
-                + "\n"
-                + "Example: "
-                + "y" * 600
-                + "\n"
-                + "Code: "
-                + "z" * 500
-                + "\n\n"
-            )
-            * 12,  # ~18K chars
-            "# Testing Baseline\n"
-            + (
-                "## Test: "
-                + "x" * 400
-                + "\n"
-                + "Coverage: "
-                + "y" * 600
-                + "\n"
-                + "Assert: "
-                + "z" * 500
-                + "\n\n"
-            )
-            * 12,  # ~18K chars
-            "# Auth Security\n"
-            + ("## Auth pattern: " + "x" * 400 + "\n" + "Implementation: " + "y" * 600 + "\n\n")
-            * 10,  # ~10K chars
-            "# Database Design\n"
-            + ("## DB rule: " + "x" * 400 + "\n" + "Schema: " + "y" * 600 + "\n\n")
-            * 10,  # ~10K chars
-            "# API Patterns\n"
-            + ("## API guideline: " + "x" * 400 + "\n" + "Endpoint: " + "y" * 600 + "\n\n")
-            * 12,  # ~12K chars
+            "# Core Always Guardrails\n" + _CORE_BLOCK * 15,  # ~22K chars
+            "# Security Baseline\n" + _SECURITY_BLOCK * 12,  # ~18K chars
+            "# Testing Baseline\n" + _TESTING_BLOCK * 12,  # ~18K chars
+            "# Auth Security\n" + _AUTH_BLOCK * 10,  # ~10K chars
+            "# Database Design\n" + _DB_BLOCK * 10,  # ~10K chars
+            "# API Patterns\n" + _API_BLOCK * 12,  # ~12K chars
         ]
         old_context = "\n\n".join(old_guardrails)
         old_tokens = count_tokens(old_context)
@@ -128,8 +154,7 @@ class TestContextSizeReduction:
         # Target: 60%+ reduction (allows for variation)
         assert reduction_pct >= 60, f"Context only reduced by {reduction_pct:.1f}%"
 
-    @pytest.mark.asyncio
-    async def test_creative_task_minimal_context(self, test_config):
+    def test_creative_task_minimal_context(self, test_config):
         """Verify creative tasks use minimal context."""
         from guardloop.core.context_manager import ContextManager
 
@@ -152,8 +177,7 @@ class TestContextSizeReduction:
 class TestResponseTimeImprovement:
     """Test response time optimization"""
 
-    @pytest.mark.asyncio
-    async def test_agent_chain_reduces_execution_time(self):
+    def test_agent_chain_reduces_execution_time(self):
         """Verify optimized agent chains execute faster."""
         from guardloop.agents.chain_optimizer import AgentChainOptimizer
 
@@ -192,8 +216,7 @@ class TestResponseTimeImprovement:
         assert improvement_simple >= 75, f"Simple tasks should be 75%+ faster"
         assert improvement_medium >= 50, f"Medium tasks should be 50%+ faster"
 
-    @pytest.mark.asyncio
-    async def test_budget_manager_calculates_quickly(self):
+    def test_budget_manager_calculates_quickly(self):
         """Verify budget calculations are performant."""
         from guardloop.core.budget_manager import ContextBudgetManager
 
@@ -220,178 +243,127 @@ class TestResponseTimeImprovement:
 class TestCreativeTaskSkip:
     """Test creative task bypass logic"""
 
-    @pytest.mark.asyncio
-    async def test_creative_tasks_skip_guardrails(self):
-        """Verify creative tasks bypass guardrail validation."""
-        from guardloop.core.task_classifier import TaskClassifier
-
-        classifier = TaskClassifier()
-
-        # Test creative prompts
-        creative_prompts = [
+    @pytest.mark.parametrize(
+        "prompt",
+        [
             "write a poem about coding",
             "create a blog post about AI",
             "draft documentation outline",
             "brainstorm feature ideas",
-        ]
-
-        for prompt in creative_prompts:
-            classification = classifier.classify(prompt)
-
-            # Should be classified as creative/content
-            assert classification.task_type in [
-                "creative",
-                "content",
-            ], f"'{prompt}' not classified as creative: {classification.task_type}"
-
-            # Should not require guardrails
-            assert (
-                classification.requires_guardrails is False
-            ), f"Creative task requires guardrails: {prompt}"
+        ],
+    )
+    def test_creative_tasks_skip_guardrails(self, classifier, prompt):
+        """Verify creative tasks bypass guardrail validation."""
+        classification = classifier.classify(prompt)
 
-            print(f"\n✓ '{prompt[:40]}...' → {classification.task_type} (skip guardrails)")
+        # Should be classified as creative/content
+        assert classification.task_type in [
+            "creative",
+            "content",
+        ], f"'{prompt}' not classified as creative: {classification.task_type}"
 
-    @pytest.mark.asyncio
-    async def test_code_tasks_require_guardrails(self):
-        """Verify code tasks still get guardrails."""
-        from guardloop.core.task_classifier import TaskClassifier
+        # Should not require guardrails
+        assert (
+            classification.requires_guardrails is False
+        ), f"Creative task requires guardrails: {prompt}"
 
-        classifier = TaskClassifier()
+        print(f"\n✓ '{prompt[:40]}...' → {classification.task_type} (skip guardrails)")
 
-        # Test code prompts
-        code_prompts = [
+    @pytest.mark.parametrize(
+        "prompt",
+        [
             "implement user authentication",
             "create API endpoint for login",
             "add SQL injection prevention",
-        ]
-
-        for prompt in code_prompts:
-            classification = classifier.classify(prompt)
+        ],
+    )
+    def test_code_tasks_require_guardrails(self, classifier, prompt):
+        """Verify code tasks still get guardrails."""
+        classification = classifier.classify(prompt)
 
-            # Should require guardrails
-            assert (
-                classification.requires_guardrails is True
-            ), f"Code task doesn't require guardrails: {prompt}"
+        # Should require guardrails
+        assert (
+            classification.requires_guardrails is True
+        ), f"Code task doesn't require guardrails: {prompt}"
 
-            print(f"\n✓ '{prompt[:40]}...' → {classification.task_type} (apply guardrails)")
+        print(f"\n✓ '{prompt[:40]}...' → {classification.task_type} (apply guardrails)")
 
 
 class TestAgentChainOptimization:
     """Test agent chain optimization"""
 
-    def test_simple_task_minimal_agents(self):
+    @pytest.mark.parametrize("task", ["fix_typo", "update_docs", "format_code"])
+    def test_simple_task_minimal_agents(self, optimizer, task):
         """Verify simple tasks use minimal agents."""
-        from guardloop.agents.chain_optimizer import AgentChainOptimizer
-
-        optimizer = AgentChainOptimizer()
+        chain = optimizer.select_chain(task, "standard")
+        complexity = optimizer.get_complexity(task)
 
-        simple_tasks = ["fix_typo", "update_docs", "format_code"]
-
-        for task in simple_tasks:
-            chain = optimizer.select_chain(task, "standard")
-            complexity = optimizer.get_complexity(task)
+        assert len(chain) <= 2, f"{task} uses too many agents: {len(chain)} (chain: {chain})"
+        assert complexity.value == "simple", f"{task} complexity not simple: {complexity.value}"
 
-            assert len(chain) <= 2, f"{task} uses too many agents: {len(chain)} (chain: {chain})"
-            assert complexity.value == "simple", f"{task} complexity not simple: {complexity.value}"
+        print(f"\n✓ {task}: {len(chain)} agents → {chain}")
 
-            print(f"\n✓ {task}: {len(chain)} agents → {chain}")
-
-    def test_medium_task_focused_chain(self):
+    # Medium tasks have 3-5 agents
+    @pytest.mark.parametrize("task", ["implement_function", "refactor"])
+    def test_medium_task_focused_chain(self, optimizer, task):
         """Verify medium tasks use focused chains."""
-        from guardloop.agents.chain_optimizer import AgentChainOptimizer
+        chain = optimizer.select_chain(task, "standard")
+        complexity = optimizer.get_complexity(task)
 
-        optimizer = AgentChainOptimizer()
+        # Medium tasks should have 3-5 agents for focused execution
+        assert 3 <= len(chain) <= 5, f"{task} chain length wrong: {len(chain)} (chain: {chain})"
+        assert complexity.value == "medium", f"{task} complexity not medium: {complexity.value}"
 
-        # Medium tasks have 3-5 agents
-        medium_tasks = ["implement_function", "refactor"]
+        print(f"\n✓ {task}: {len(chain)} agents → {chain}")
 
-        for task in medium_tasks:
-            chain = optimizer.select_chain(task, "standard")
-            complexity = optimizer.get_complexity(task)
-
-            # Medium tasks should have 3-5 agents for focused execution
-            assert 3 <= len(chain) <= 5, f"{task} chain length wrong: {len(chain)} (chain: {chain})"
-            assert complexity.value == "medium", f"{task} complexity not medium: {complexity.value}"
-
-            print(f"\n✓ {task}: {len(chain)} agents → {chain}")
-
-    def test_critical_task_full_validation(self):
+    @pytest.mark.parametrize("task", ["build_auth_system", "implement_payment"])
+    def test_critical_task_full_validation(self, optimizer, task):
         """Verify critical tasks get full validation."""
-        from guardloop.agents.chain_optimizer import AgentChainOptimizer
-
-        optimizer = AgentChainOptimizer()
-
-        critical_tasks = ["build_auth_system", "implement_payment"]
-
-        for task in critical_tasks:
-            standard_chain = optimizer.select_chain(task, "standard")
-            strict_chain = optimizer.select_chain(task, "strict")
-            complexity = optimizer.get_complexity(task)
+        standard_chain = optimizer.select_chain(task, "standard")
+        strict_chain = optimizer.select_chain(task, "strict")
+        complexity = optimizer.get_complexity(task)
 
-            assert (
-                len(standard_chain) >= 5
-            ), f"{task} standard chain too short: {len(standard_chain)}"
-            assert len(strict_chain) >= len(standard_chain), f"{task} strict chain not longer"
-            assert (
-                complexity.value == "critical"
-            ), f"{task} complexity not critical: {complexity.value}"
+        assert len(standard_chain) >= 5, f"{task} standard chain too short: {len(standard_chain)}"
+        assert len(strict_chain) >= len(standard_chain), f"{task} strict chain not longer"
+        assert complexity.value == "critical", f"{task} complexity not critical: {complexity.value}"
 
-            # Verify strict mode adds compliance
-            assert (
-                "secops_engineer" in strict_chain or "secops" in strict_chain
-            ), f"{task} strict mode missing security"
-            assert "standards_oracle" in strict_chain, f"{task} strict mode missing standards"
+        # Verify strict mode adds compliance
+        assert (
+            "secops_engineer" in strict_chain or "secops" in strict_chain
+        ), f"{task} strict mode missing security"
+        assert "standards_oracle" in strict_chain, f"{task} strict mode missing standards"
 
-            print(
-                f"\n✓ {task}: {len(standard_chain)} agents (standard), {len(strict_chain)} agents (strict)"
-            )
+        print(
+            f"\n✓ {task}: {len(standard_chain)} agents (standard), {len(strict_chain)} agents (strict)"
+        )
 
 
 class TestSemanticMatching:
     """Test semantic matching performance"""
 
-    @pytest.mark.asyncio
-    async def test_semantic_matching_faster_than_keyword(self):
-        """Verify semantic matching finds relevant rules efficiently."""
-        # Skip if numpy/sentence-transformers not installed
-        pytest.importorskip("numpy")
-        pytest.importorskip("sentence_transformers")
-
-        # Mock guardrails
-        guardrails = []
-        for i in range(100):
-            g = Mock()
-            g.id = i
-            g.rule_text = f"Security rule {i}: Validate input and prevent injection"
-            g.rule_metadata = {}
-            guardrails.append(g)
-
-        # Test semantic matching speed
-        from guardloop.core.semantic_matcher import SemanticGuardrailMatcher
-
-        matcher = SemanticGuardrailMatcher()
-
-        # Index guardrails
+    async def test_index_time(self, semantic_matcher, mock_guardrails):
+        """Verify indexing 100 guardrails stays fast."""
         start = time.time()
-        await matcher.index_guardrails(guardrails)
+        await semantic_matcher.index_guardrails(mock_guardrails)
         index_time = time.time() - start
 
-        # Find relevant
+        print(f"\nIndexing 100 guardrails: {index_time*1000:.1f}ms")
+
+        assert index_time < 5.0, f"Indexing too slow: {index_time:.2f}s"
+
+    async def test_search_time(self, indexed_semantic_matcher, mock_guardrails):
+        """Verify semantic matching finds relevant rules efficiently."""
         start = time.time()
-        results = await matcher.find_relevant(
+        await indexed_semantic_matcher.find_relevant(
             prompt="Implement SQL injection prevention",
-            guardrails=guardrails,
+            guardrails=mock_guardrails,
             top_k=5,
             threshold=0.3,
         )
         search_time = time.time() - start
 
-        print(f"\nSemantic matching performance:")
-        print(f"Indexing 100 guardrails: {index_time*1000:.1f}ms")
-        print(f"Finding top 5: {search_time*1000:.1f}ms")
+        print(f"\nFinding top 5: {search_time*1000:.1f}ms")
 
-        # Should be reasonably fast
-        assert index_time < 5.0, f"Indexing too slow: {index_time:.2f}s"
         assert search_time < 1.0, f"Search too slow: {search_time:.2f}s"
 
 
@@ -410,17 +382,18 @@ class TestBudgetAllocation:
         for total_budget in budgets:
             allocation = manager.allocate_budget(total_budget)
 
+            assert len(allocation) == len(_ALLOCATION_KEYS), f"Unexpected keys: {allocation}"
+            agents, specialized, core, learned = _get_allocation(allocation)
+
             # Verify allocation sums to budget
-            allocated_total = sum(allocation.values())
+            allocated_total = agents + specialized + core + learned
             assert (
                 allocated_total == total_budget
             ), f"Allocation mismatch: {allocated_total} != {total_budget}"
 
             # Verify ratios
-            assert (
-                allocation["agents"] > allocation["specialized"]
-            ), "Agents should get more than specialized"
-            assert allocation["core"] > allocation["learned"], "Core should get more than learned"
+            assert agents > specialized, "Agents should get more than specialized"
+            assert core > learned, "Core should get more than learned"
 
             print(f"\n✓ Budget {total_budget:,}: {allocation}")
 
@@ -460,8 +433,7 @@ class TestBudgetAllocation:
 class TestRegressionSuite:
     """Regression tests to prevent performance degradation"""
 
-    @pytest.mark.asyncio
-    async def test_no_regression_in_context_size(self):
+    def test_no_regression_in_context_size(self):
         """Ensure context size doesn't regress."""
         from guardloop.core.context_manager import ContextManager
 
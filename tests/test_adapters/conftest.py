@@ -0,0 +1,33 @@
+"""Shared fixtures for adapter tests"""
+
+import pytest
+
+from guardloop.adapters import ClaudeAdapter, CodexAdapter, GeminiAdapter
+
+
+@pytest.fixture(scope="session")
+def claude_adapter():
+    """Claude adapter shared across the session"""
+    return ClaudeAdapter(cli_path="claude", timeout=30)
+
+
+@pytest.fixture(scope="session")
+def gemini_adapter():
+    """Gemini adapter shared across the session"""
+    return GeminiAdapter(cli_path="gemini", timeout=30)
+
+
+@pytest.fixture(scope="session")
+def codex_adapter():
+    """Codex adapter shared across the session"""
+    return CodexAdapter(cli_path="codex", timeout=30)
+
+
+@pytest.fixture(scope="session")
+def adapters(claude_adapter, gemini_adapter, codex_adapter):
+    """Session adapters keyed by CLI name (patch attributes, don't assign them)"""
+    return {
+        "claude": claude_adapter,
+        "gemini": gemini_adapter,
+        "codex": codex_adapter,
+    }
@@ -1,5 +1,7 @@
 """Unit tests for AI tool adapters"""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from guardloop.adapters import (
@@ -11,6 +13,27 @@ from guardloop.adapters import (
     AdapterFactory,
 )
 
+# CLI name -> (adapter class, display name)
+ADAPTER_CASES = {
+    "claude": (ClaudeAdapter, "Claude"),
+    "gemini": (GeminiAdapter, "Gemini"),
+    "codex": (CodexAdapter, "Codex"),
+}
+
+# Canned execute() results keyed by display name; treat as read-only
+CANNED_RESPONSES = {
+    tool_name: AIResponse(
+        raw_output=f"Test response from {tool_name}",
+        execution_time_ms=1000,
+        exit_code=0,
+        stdout=f"Test response from {tool_name}",
+    )
+    for _, tool_name in ADAPTER_CASES.values()
+}
+OK_RESP = AIResponse("Test", 100, exit_code=0)
+SUCCESS_RESP = AIResponse("Success", 100, exit_code=0)
+FAILED_RESP = AIResponse("", 0, exit_code=1, error="Failed")
+
 
 class TestAIResponse:
     """Test AIResponse dataclass"""
@@ -32,108 +55,59 @@ class TestAIResponse:
         assert response.exit_code == 0
 
 
-class TestClaudeAdapter:
-    """Test Claude adapter"""
+class TestAdapter:
+    """Test behaviour shared by the Claude, Gemini and Codex adapters"""
+
+    @pytest.fixture(scope="session", params=list(ADAPTER_CASES))
+    def cli_path(self, request):
+        """CLI name of the adapter under test"""
+        return request.param
 
-    @pytest.fixture
-    def adapter(self):
-        """Create Claude adapter"""
-        return ClaudeAdapter(cli_path="claude", timeout=30)
+    @pytest.fixture(scope="session")
+    def tool_name(self, cli_path):
+        """Display name of the adapter under test"""
+        return ADAPTER_CASES[cli_path][1]
 
-    def test_initialization(self, adapter):
+    @pytest.fixture(scope="session")
+    def adapter(self, adapters, cli_path):
+        """Session adapter under test"""
+        return adapters[cli_path]
+
+    def test_initialization(self, adapter, cli_path, tool_name):
         """Test adapter initialization"""
-        assert adapter.cli_path == "claude"
-        assert adapter.timeout == 30
-        assert adapter.tool_name == "Claude"
+        assert (adapter.cli_path, adapter.timeout, adapter.tool_name) == (cli_path, 30, tool_name)
 
-    @pytest.mark.asyncio
-    async def test_execute_with_mock(self, adapter):
+    async def test_execute_with_mock(self, adapter, tool_name, monkeypatch):
         """Test execute with mocked subprocess"""
-        mock_response = AIResponse(
-            raw_output="Test response",
-            execution_time_ms=1000,
-            exit_code=0,
-            stdout="Test response",
-        )
+        mock_response = CANNED_RESPONSES[tool_name]
+
+        async def _stub(*_args, **_kwargs):
+            return mock_response
 
-        adapter._execute_with_retry = AsyncMock(return_value=mock_response)
+        monkeypatch.setattr(adapter, "_execute_with_retry", _stub)
 
         response = await adapter.execute("Test prompt")
 
-        assert response.raw_output == "Test response"
+        assert response.raw_output == f"Test response from {tool_name}"
         assert response.execution_time_ms == 1000
 
-    def test_validate_installation_not_installed(self, adapter):
-        """Test validation when tool not installed"""
-        with patch.object(adapter, "is_installed", return_value=False):
-            assert adapter.validate_installation() is False
-
-    def test_validate_installation_success(self, adapter):
-        """Test validation when tool is installed"""
-        with patch.object(adapter, "is_installed", return_value=True):
-            with patch.object(adapter, "get_version", return_value="1.0.0"):
-                assert adapter.validate_installation() is True
-
-
-class TestGeminiAdapter:
-    """Test Gemini adapter"""
-
-    @pytest.fixture
-    def adapter(self):
-        """Create Gemini adapter"""
-        return GeminiAdapter(cli_path="gemini", timeout=30)
-
-    def test_initialization(self, adapter):
-        """Test adapter initialization"""
-        assert adapter.cli_path == "gemini"
-        assert adapter.timeout == 30
-        assert adapter.tool_name == "Gemini"
-
-
-class TestCodexAdapter:
-    """Test Codex adapter"""
-
-    @pytest.fixture
-    def adapter(self):
-        """Create Codex adapter"""
-        return CodexAdapter(cli_path="codex", timeout=30)
-
-    def test_initialization(self, adapter):
-        """Test adapter initialization"""
-        assert adapter.cli_path == "codex"
-        assert adapter.timeout == 30
-        assert adapter.tool_name == "Codex"
-
 
 class TestAdapterFactory:
     """Test AdapterFactory"""
 
-    def test_get_adapter_claude(self):
-        """Test getting Claude adapter"""
-        adapter = AdapterFactory.get_adapter("claude", timeout=30)
+    @pytest.mark.parametrize("tool", list(ADAPTER_CASES))
+    def test_get_adapter(self, tool):
+        """Test getting each supported adapter"""
+        adapter = AdapterFactory.get_adapter(tool, timeout=30)
 
-        assert isinstance(adapter, ClaudeAdapter)
+        assert isinstance(adapter, ADAPTER_CASES[tool][0])
         assert adapter.timeout == 30
 
-    def test_get_adapter_gemini(self):
-        """Test getting Gemini adapter"""
-        adapter = AdapterFactory.get_adapter("gemini", timeout=30)
-
-        assert isinstance(adapter, GeminiAdapter)
-
-    def test_get_adapter_codex(self):
-        """Test getting Codex adapter"""
-        adapter = AdapterFactory.get_adapter("codex", timeout=30)
-
-        assert isinstance(adapter, CodexAdapter)
-
     def test_get_adapter_invalid(self):
         """Test getting invalid adapter"""
-        with pytest.raises(ValueError) as exc_info:
+        with pytest.raises(ValueError, match="Unsupported AI tool"):
             AdapterFactory.get_adapter("invalid_tool")
 
-        assert "Unsupported AI tool" in str(exc_info.value)
-
     def test_get_adapter_with_custom_path(self):
         """Test getting adapter with custom CLI path"""
         adapter = AdapterFactory.get_adapter("claude", cli_path="/custom/path/claude", timeout=60)
@@ -168,51 +142,72 @@ class TestAdapterFactory:
 class TestBaseAdapter:
     """Test BaseAdapter functionality"""
 
-    def test_is_installed(self):
+    def test_is_installed(self, claude_adapter):
         """Test command existence check"""
-        adapter = ClaudeAdapter()
-
         with patch("shutil.which", return_value="/usr/bin/claude"):
-            assert adapter.is_installed() is True
+            assert claude_adapter.is_installed() is True
 
         with patch("shutil.which", return_value=None):
-            assert adapter.is_installed() is False
+            assert claude_adapter.is_installed() is False
 
-    def test_parse_version(self):
+    def test_parse_version(self, claude_adapter):
         """Test version parsing"""
-        adapter = ClaudeAdapter()
+        assert claude_adapter._parse_version("version 1.2.3") == "1.2.3"
+        assert claude_adapter._parse_version("v2.0.0") == "2.0.0"
+        assert claude_adapter._parse_version("Claude CLI 1.5.0") == "1.5.0"
+
+    @pytest.mark.parametrize("tool", list(ADAPTER_CASES))
+    def test_validate_installation_not_installed(self, adapters, tool):
+        """Test validation when tool not installed"""
+        adapter = adapters[tool]
+
+        with patch.object(adapter, "is_installed", return_value=False):
+            assert adapter.validate_installation() is False
+
+    @pytest.mark.parametrize("tool", list(ADAPTER_CASES))
+    def test_validate_installation_success(self, adapters, tool):
+        """Test validation when tool is installed"""
+        adapter = adapters[tool]
+
+        with patch.multiple(
+            adapter,
+            is_installed=MagicMock(return_value=True),
+            get_version=MagicMock(return_value="1.0.0"),
+        ):
+            assert adapter.validate_installation() is True
 
-        assert adapter._parse_version("version 1.2.3") == "1.2.3"
-        assert adapter._parse_version("v2.0.0") == "2.0.0"
-        assert adapter._parse_version("Claude CLI 1.5.0") == "1.5.0"
 
-    @pytest.mark.asyncio
-    async def test_execute_with_timeout(self):
+class TestRetryLogic:
+    """Test BaseAdapter retry and timeout handling"""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff_sleep(self, monkeypatch):
+        """Skip real retry backoff so retry paths are logic-only"""
+        sleep = AsyncMock()
+        monkeypatch.setattr("asyncio.sleep", sleep)
+        return sleep
+
+    async def test_execute_with_timeout(self, claude_adapter, monkeypatch):
         """Test execution timeout handling"""
-        adapter = ClaudeAdapter(timeout=1)
 
         # Mock a long-running process that will timeout
         async def mock_long_process(prompt, timeout, stream_callback=None):
-            import asyncio
-
             # Simulate timeout by raising TimeoutError
             raise asyncio.TimeoutError("Simulated timeout")
 
-        adapter._execute_subprocess = mock_long_process
+        monkeypatch.setattr(claude_adapter, "_execute_subprocess", mock_long_process)
 
-        response = await adapter._execute_with_retry("test", timeout=1)
+        response = await claude_adapter._execute_with_retry("test", timeout=1)
 
         # Should fail due to timeout
         assert response.exit_code != 0
         assert response.error is not None
         assert "Timeout" in response.error
 
-    @pytest.mark.asyncio
-    async def test_retry_logic(self):
+    async def test_retry_logic(self, claude_adapter, monkeypatch):
         """Test retry logic on failure"""
-        adapter = ClaudeAdapter()
-        adapter.max_retries = 3
-        adapter.retry_delay = 0.01  # Fast retry for testing
+        monkeypatch.setattr(claude_adapter, "max_retries", 3)
+        monkeypatch.setattr(claude_adapter, "retry_delay", 0)  # No backoff for testing
 
         call_count = 0
 
@@ -220,40 +215,37 @@ class TestBaseAdapter:
             nonlocal call_count
             call_count += 1
             if call_count < 3:
-                return AIResponse("", 0, exit_code=1, error="Failed")
-            return AIResponse("Success", 100, exit_code=0)
+                return FAILED_RESP
+            return SUCCESS_RESP
 
-        adapter._execute_subprocess = mock_failing_execute
+        monkeypatch.setattr(claude_adapter, "_execute_subprocess", mock_failing_execute)
 
-        response = await adapter._execute_with_retry("test")
+        response = await claude_adapter._execute_with_retry("test")
 
         # Should have retried and eventually succeeded
         assert call_count == 3
         assert response.exit_code == 0
 
 
-@pytest.mark.asyncio
 class TestAsyncAdapterOperations:
     """Test async adapter operations"""
 
-    async def test_concurrent_execution(self):
-        """Test executing multiple adapters concurrently"""
-        import asyncio
-
+    async def test_execute_each_adapter(self):
+        """Test each adapter executes through its retry wrapper"""
         adapters = [
             ClaudeAdapter(),
             GeminiAdapter(),
             CodexAdapter(),
         ]
 
+        async def _stub(*_args, **_kwargs):
+            return OK_RESP
+
         # Mock all executions
         for adapter in adapters:
-            adapter._execute_with_retry = AsyncMock(
-                return_value=AIResponse("Test", 100, exit_code=0)
-            )
+            adapter._execute_with_retry = _stub
 
-        # Execute concurrently
-        results = await asyncio.gather(*[adapter.execute("test") for adapter in adapters])
+        results = [await adapter.execute("test") for adapter in adapters]
 
         assert len(results) == 3
         assert all(r.exit_code == 0 for r in results)
@@ -0,0 +1,29 @@
+"""Shared fixtures for agent tests"""
+
+import pytest
+
+from guardloop.core.parser import CodeBlock, ParsedResponse
+from guardloop.utils.config import Config
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Agent test configuration, built once per session"""
+    # Agents only store the config, so one instance serves every test
+    return Config(mode="standard", tool="implement", strict=False)
+
+
+@pytest.fixture(scope="session")
+def empty_parsed():
+    """Parsed response without code blocks (read-only)"""
+    return ParsedResponse(code_blocks=[])
+
+
+@pytest.fixture(scope="session")
+def feature_parsed():
+    """Parsed response with a single untested feature function (read-only)"""
+    return ParsedResponse(
+        code_blocks=[
+            CodeBlock(language="python", content="def feature(): pass", file_path="feature.py")
+        ]
+    )
@@ -1,5 +1,7 @@
 """Comprehensive agent system tests"""
 
+import asyncio
+
 import pytest
 from pathlib import Path
 from typing import List
@@ -21,25 +23,69 @@ from guardloop.agents.documentation import DocumentationAgent
 from guardloop.core.parser import ParsedResponse, CodeBlock
 from guardloop.core.validator import Violation
 from guardloop.core.failure_detector import DetectedFailure
-from guardloop.utils.config import Config
 
 
-# Fixtures
+# Code samples shared by contexts and tests
+_CODER_SNIPPET = """
+def authenticate_user(username: str, password: str) -> User:
+    try:
+        user = db.get_user(username)
+        if not user or not verify_password(password, user.password_hash):
+            raise AuthenticationError("Invalid credentials")
+        return user
+    except Exception as e:
+        logger.error(f"Authentication failed: {e}")
+        raise
 
+def test_authenticate_user():
+    user = authenticate_user("test", "password123")
+    assert user.username == "test"
+            """
 
-@pytest.fixture
-def config():
-    """Create test config"""
-    return Config(mode="standard", tool="implement", strict=False)
+_TESTER_SNIPPET = """
+def test_authentication_success():
+    user = authenticate_user("valid", "password")
+    assert user.username == "valid"
 
+def test_authentication_failure():
+    with pytest.raises(AuthenticationError):
+        authenticate_user("invalid", "wrong")
 
-@pytest.fixture
-def strict_config():
-    """Create strict mode config"""
-    return Config(mode="strict", tool="implement", strict=True)
+def test_sql_injection():
+    # Test SQL injection security vulnerability
+    with pytest.raises(ValidationError):
+        authenticate_user("admin' OR '1'='1", "any")
 
+def test_e2e_login():
+    # E2E integration test for login flow
+    response = client.post("/login", json={"username": "test", "password": "pass"})
+    assert response.status_code == 200
+            """
 
-@pytest.fixture
+_CHAIN_SNIPPET = """
+def authenticate(username: str, password: str) -> User:
+    user = db.query("SELECT * FROM users WHERE username = ?", username)
+    if verify_password(password, user.password_hash):
+        return user
+    raise AuthError()
+
+def test_authenticate():
+    user = authenticate("test", "pass")
+    assert user.username == "test"
+                    """
+
+_FULL_REWRITE_BLOB = "# Full file content...\n" * 100
+
+
+def _blob(decision: AgentDecision) -> str:
+    """Lowercased suggestions, one per line, for substring assertions"""
+    return "\n".join(decision.suggestions).lower()
+
+
+# Fixtures
+
+
+@pytest.fixture(scope="module")
 def basic_context():
     """Create basic agent context"""
     return AgentContext(
@@ -49,7 +95,7 @@ def basic_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def architect_context():
     """Context for architecture validation"""
     return AgentContext(
@@ -67,27 +113,13 @@ def architect_context():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def coder_context():
     """Context for code validation"""
     code_blocks = [
         CodeBlock(
             language="python",
-            content="""
-def authenticate_user(username: str, password: str) -> User:
-    try:
-        user = db.get_user(username)
-        if not user or not verify_password(password, user.password_hash):
-            raise AuthenticationError("Invalid credentials")
-        return user
-    except Exception as e:
-        logger.error(f"Authentication failed: {e}")
-        raise
-
-def test_authenticate_user():
-    user = authenticate_user("test", "password123")
-    assert user.username == "test"
-            """,
+            content=_CODER_SNIPPET,
             file_path="auth.py",
         )
     ]
@@ -100,31 +132,13 @@ def test_authenticate_user():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tester_context():
     """Context for test validation"""
     code_blocks = [
         CodeBlock(
             language="python",
-            content="""
-def test_authentication_success():
-    user = authenticate_user("valid", "password")
-    assert user.username == "valid"
-
-def test_authentication_failure():
-    with pytest.raises(AuthenticationError):
-        authenticate_user("invalid", "wrong")
-
-def test_sql_injection():
-    # Test SQL injection security vulnerability
-    with pytest.raises(ValidationError):
-        authenticate_user("admin' OR '1'='1", "any")
-
-def test_e2e_login():
-    # E2E integration test for login flow
-    response = client.post("/login", json={"username": "test", "password": "pass"})
-    assert response.status_code == 200
-            """,
+            content=_TESTER_SNIPPET,
             file_path="test_auth.py",
         )
     ]
@@ -182,122 +196,106 @@ class TestAgentBase:
         confidence = agent._calculate_confidence(False, 3, 5)
         assert 0.5 <= confidence <= 0.8
 
+    def test_contains_keywords(self, config):
+        """Test case-insensitive literal keyword matching"""
+        agent = ArchitectAgent(config)
+
+        assert agent._contains_keywords("CREATE TABLE users", ["create table"]) is True
+        assert agent._contains_keywords("print(x)", ["print("]) is True
+        assert agent._contains_keywords("a.b", ["a*b"]) is False  # Keywords are literal
+        assert agent._contains_keywords("anything", []) is False
+
 
 # Orchestrator Tests
 
 
+@pytest.mark.xdist_group("agents")
 class TestOrchestrator:
     """Test orchestrator routing and orchestration"""
 
-    @pytest.mark.asyncio
     async def test_orchestrator_initialization(self, config):
         """Test orchestrator agent loads correctly"""
         orchestrator = OrchestratorAgent(config)
         assert orchestrator.name == "orchestrator"
         assert orchestrator.agents == {}
 
-    @pytest.mark.asyncio
-    async def test_load_agents(self, config):
+    async def test_load_agents(self, loaded_orchestrator):
         """Test agent loading"""
-        orchestrator = OrchestratorAgent(config)
-        await orchestrator.load_agents()
+        agents = loaded_orchestrator.agents
 
         # Verify all 12 agents loaded
-        assert len(orchestrator.agents) == 12
-        assert "architect" in orchestrator.agents
-        assert "coder" in orchestrator.agents
-        assert "tester" in orchestrator.agents
-        assert "secops" in orchestrator.agents
-        assert "evaluator" in orchestrator.agents
-
-    @pytest.mark.asyncio
-    async def test_routing_architecture(self, config):
-        """Test routing to architect agent"""
-        orchestrator = OrchestratorAgent(config)
-
-        agent_name = await orchestrator.route("Design a microservices architecture")
-        assert agent_name == "architect"
-
-    @pytest.mark.asyncio
-    async def test_routing_implementation(self, config):
-        """Test routing to coder agent"""
-        orchestrator = OrchestratorAgent(config)
-
-        agent_name = await orchestrator.route("Implement user authentication API")
-        assert agent_name == "coder"
-
-    @pytest.mark.asyncio
-    async def test_routing_testing(self, config):
-        """Test routing to tester agent"""
-        orchestrator = OrchestratorAgent(config)
-
-        agent_name = await orchestrator.route("Create test coverage for authentication")
-        assert agent_name == "tester"
-
-    @pytest.mark.asyncio
-    async def test_routing_debugging(self, config):
-        """Test routing to debug_hunter agent"""
-        orchestrator = OrchestratorAgent(config)
-
-        agent_name = await orchestrator.route("Fix the login bug causing 500 errors")
-        assert agent_name == "debug_hunter"
-
-    @pytest.mark.asyncio
-    async def test_routing_security(self, config):
-        """Test routing to secops agent"""
-        orchestrator = OrchestratorAgent(config)
+        assert len(agents) == 12
+        assert "architect" in agents
+        assert "coder" in agents
+        assert "tester" in agents
+        assert "secops" in agents
+        assert "evaluator" in agents
+
+    @pytest.mark.parametrize(
+        "prompt,expected",
+        [
+            ("Design a microservices architecture", "architect"),
+            ("Implement user authentication API", "coder"),
+            ("Create test coverage for authentication", "tester"),
+            ("Fix the login bug causing 500 errors", "debug_hunter"),
+            ("Add security validation and MFA", "secops"),
+            ("Random task with no specific keywords", "architect"),  # Default agent
+        ],
+        ids=["architecture", "implementation", "testing", "debugging", "security", "default"],
+    )
+    async def test_routing(self, mocked_orchestrator, prompt, expected):
+        """Test keyword routing to the expected agent"""
+        assert await mocked_orchestrator.route(prompt) == expected
 
-        agent_name = await orchestrator.route("Add security validation and MFA")
-        assert agent_name == "secops"
+    async def test_routing_cache_hit(self, mocked_orchestrator):
+        """Test repeated prompts are served from the routing cache"""
+        first = await mocked_orchestrator.route("Review the  code QUALITY")
+        hits = mocked_orchestrator.get_stats()["route_cache"]["hits"]
 
-    @pytest.mark.asyncio
-    async def test_routing_default(self, config):
-        """Test default routing when no keywords match"""
-        orchestrator = OrchestratorAgent(config)
+        # Case and whitespace differences normalize to the same cache key
+        assert await mocked_orchestrator.route("review the code quality") == first
+        assert mocked_orchestrator.get_stats()["route_cache"]["hits"] == hits + 1
 
-        agent_name = await orchestrator.route("Random task with no specific keywords")
-        assert agent_name == "architect"  # Default agent
-
-    @pytest.mark.asyncio
-    async def test_orchestration_chain_standard(self, config, architect_context):
+    async def test_orchestration_chain_standard(self, mocked_orchestrator, architect_context):
         """Test standard mode orchestration chain"""
-        orchestrator = OrchestratorAgent(config)
-        await orchestrator.load_agents()
+        chain = mocked_orchestrator.chain_optimizer.select_chain("implement_function")
 
-        decisions = await orchestrator.orchestrate(architect_context, user_agent="architect")
+        decisions = await mocked_orchestrator.orchestrate(architect_context)
 
-        # In test environment without registered agents, may return empty list
-        # Test verifies orchestrator doesn't crash on valid input
-        assert isinstance(decisions, list)
+        # Every agent approves, so the whole chain runs in order
+        assert chain == ["cold_blooded_architect", "ruthless_coder", "ruthless_tester"]
+        assert [d.agent_name for d in decisions] == chain
+        assert all(d.approved for d in decisions)
+        for name in chain:
+            mocked_orchestrator.agents[name].evaluate.assert_awaited_once_with(architect_context)
 
-    @pytest.mark.asyncio
-    async def test_orchestration_chain_strict(self, strict_config):
+    async def test_orchestration_chain_strict(self, mocked_strict_orchestrator):
         """Test strict mode stops on non-approval"""
-        orchestrator = OrchestratorAgent(strict_config)
-        await orchestrator.load_agents()
-
-        # Context that will fail architect validation
+        # Context that the (mocked) architect rejects
         failing_context = AgentContext(
             prompt="Vague request", mode="strict", raw_output="Some output"  # No clear requirements
         )
+        chain = mocked_strict_orchestrator.chain_optimizer.select_chain(
+            "implement_function", mode="strict"
+        )
 
-        decisions = await orchestrator.orchestrate(failing_context, user_agent="architect")
+        decisions = await mocked_strict_orchestrator.orchestrate(failing_context, mode="strict")
 
-        # In test environment without registered agents, may return empty list
-        # Test verifies orchestrator doesn't crash on strict mode input
-        assert isinstance(decisions, list)
+        # Strict mode adds compliance agents, but the chain halts at the architect
+        assert {"secops_engineer", "standards_oracle", "merciless_evaluator"} <= set(chain)
+        assert chain[0] == "cold_blooded_architect"
+        assert [d.agent_name for d in decisions] == ["cold_blooded_architect"]
+        assert decisions[0].approved is False
 
-    @pytest.mark.asyncio
-    async def test_orchestration_max_iterations(self, config):
+    async def test_orchestration_max_iterations(self, mocked_orchestrator):
         """Test max iteration limit prevents infinite loops"""
-        orchestrator = OrchestratorAgent(config)
-        await orchestrator.load_agents()
-
-        decisions = await orchestrator.orchestrate(
+        decisions = await mocked_orchestrator.orchestrate(
             AgentContext(prompt="Test", mode="standard", raw_output="Test"), user_agent="architect"
         )
 
-        # Should not exceed max iterations
+        # A user-specified agent runs alone, once
+        assert [d.agent_name for d in decisions] == ["cold_blooded_architect"]
+        mocked_orchestrator.agents["cold_blooded_architect"].evaluate.assert_awaited_once()
         assert len(decisions) <= 10
 
 
@@ -307,7 +305,6 @@ class TestOrchestrator:
 class TestArchitectAgent:
     """Test architect agent validation"""
 
-    @pytest.mark.asyncio
     async def test_architect_approval(self, config, architect_context):
         """Test architect approves good design"""
         agent = ArchitectAgent(config)
@@ -317,38 +314,32 @@ class TestArchitectAgent:
         assert decision.confidence > 0.7
         assert decision.next_agent == "dba"
 
-    @pytest.mark.asyncio
-    async def test_architect_rejects_vague_requirements(self, config):
-        """Test architect rejects vague requirements"""
-        context = AgentContext(prompt="Make something", mode="standard", raw_output="Vague design")
-
-        agent = ArchitectAgent(config)
-        decision = await agent.evaluate(context)
-
-        assert decision.approved is False
-        assert any("vague" in s.lower() or "specify" in s.lower() for s in decision.suggestions)
-
-    @pytest.mark.asyncio
-    async def test_architect_checks_three_layers(self, config):
-        """Test architect validates three-layer design"""
-        context = AgentContext(
+    async def test_architect_flags_incomplete_designs(self, config, empty_parsed):
+        """Test architect rejects vague requirements and flags missing layers"""
+        vague = AgentContext(prompt="Make something", mode="standard", raw_output="Vague design")
+        frontend_only = AgentContext(
             prompt="Design a web app",
             mode="standard",
-            parsed_response=ParsedResponse(code_blocks=[]),
+            parsed_response=empty_parsed,
             raw_output="Only frontend design",
         )
 
         agent = ArchitectAgent(config)
-        decision = await agent.evaluate(context)
+        vague_decision, frontend_decision = await asyncio.gather(
+            agent.evaluate(vague), agent.evaluate(frontend_only)
+        )
 
+        assert vague_decision.approved is False
+        vague_blob = _blob(vague_decision)
+        assert "vague" in vague_blob or "specify" in vague_blob
         # Should suggest adding missing layers
-        assert any("3-layer" in s or "database" in s.lower() for s in decision.suggestions)
+        frontend_blob = _blob(frontend_decision)
+        assert "3-layer" in frontend_blob or "database" in frontend_blob
 
 
 class TestCoderAgent:
     """Test coder agent validation"""
 
-    @pytest.mark.asyncio
     async def test_coder_approval(self, config, coder_context):
         """Test coder approves good implementation"""
         agent = CoderAgent(config)
@@ -357,10 +348,9 @@ class TestCoderAgent:
         assert decision.approved is True
         assert decision.next_agent == "tester"
 
-    @pytest.mark.asyncio
-    async def test_coder_rejects_full_rewrite(self, config):
-        """Test coder rejects full file rewrites"""
-        context = AgentContext(
+    async def test_coder_flags_rewrites_and_missing_tests(self, config, feature_parsed):
+        """Test coder rejects full file rewrites and requires tests"""
+        full_rewrite = AgentContext(
             prompt="Implement authentication",
             mode="standard",
             raw_output="Entire file rewritten",
@@ -368,46 +358,34 @@ class TestCoderAgent:
                 code_blocks=[
                     CodeBlock(
                         language="python",
-                        content="# Full file content...\n" * 100,
+                        content=_FULL_REWRITE_BLOB,
                         file_path="auth.py",
                     )
                 ]
             ),
         )
-
-        agent = CoderAgent(config)
-        decision = await agent.evaluate(context)
-
-        # Should suggest incremental edits
-        assert any("incremental" in s.lower() or "edit" in s.lower() for s in decision.suggestions)
-
-    @pytest.mark.asyncio
-    async def test_coder_requires_tests(self, config):
-        """Test coder requires tests with implementation"""
-        context = AgentContext(
+        no_tests = AgentContext(
             prompt="Implement feature",
             mode="standard",
-            parsed_response=ParsedResponse(
-                code_blocks=[
-                    CodeBlock(
-                        language="python", content="def feature(): pass", file_path="feature.py"
-                    )
-                ]
-            ),
+            parsed_response=feature_parsed,
             raw_output="Implementation without tests",
         )
 
         agent = CoderAgent(config)
-        decision = await agent.evaluate(context)
+        rewrite_decision, no_tests_decision = await asyncio.gather(
+            agent.evaluate(full_rewrite), agent.evaluate(no_tests)
+        )
 
-        assert decision.approved is False
-        assert any("test" in s.lower() for s in decision.suggestions)
+        # Should suggest incremental edits
+        rewrite_blob = _blob(rewrite_decision)
+        assert "incremental" in rewrite_blob or "edit" in rewrite_blob
+        assert no_tests_decision.approved is False
+        assert "test" in _blob(no_tests_decision)
 
 
 class TestTesterAgent:
     """Test tester agent validation"""
 
-    @pytest.mark.asyncio
     async def test_tester_approval(self, config, tester_context):
         """Test tester approves comprehensive tests"""
         agent = TesterAgent(config)
@@ -416,26 +394,15 @@ class TestTesterAgent:
         assert decision.approved is True
         assert decision.next_agent == "secops"
 
-    @pytest.mark.asyncio
-    async def test_tester_requires_100_coverage(self, config):
-        """Test tester requires 100% coverage"""
-        context = AgentContext(
+    async def test_tester_flags_coverage_and_e2e_gaps(self, config):
+        """Test tester requires 100% coverage and E2E tests"""
+        partial_coverage = AgentContext(
             prompt="Test authentication",
             mode="standard",
             parsed_response=ParsedResponse(test_coverage=85.0),
             raw_output="Tests with 85% coverage",
         )
-
-        agent = TesterAgent(config)
-        decision = await agent.evaluate(context)
-
-        assert decision.approved is False
-        assert any("100%" in s for s in decision.suggestions)
-
-    @pytest.mark.asyncio
-    async def test_tester_requires_e2e(self, config):
-        """Test tester requires E2E tests"""
-        context = AgentContext(
+        unit_only = AgentContext(
             prompt="Test API",
             mode="standard",
             parsed_response=ParsedResponse(
@@ -449,15 +416,19 @@ class TestTesterAgent:
         )
 
         agent = TesterAgent(config)
-        decision = await agent.evaluate(context)
+        coverage_decision, unit_only_decision = await asyncio.gather(
+            agent.evaluate(partial_coverage), agent.evaluate(unit_only)
+        )
 
-        assert any("e2e" in s.lower() or "integration" in s.lower() for s in decision.suggestions)
+        assert coverage_decision.approved is False
+        assert "100%" in _blob(coverage_decision)
+        unit_only_blob = _blob(unit_only_decision)
+        assert "e2e" in unit_only_blob or "integration" in unit_only_blob
 
 
 class TestSecOpsAgent:
     """Test secops agent validation"""
 
-    @pytest.mark.asyncio
     async def test_secops_approval(self, config):
         """Test secops approves secure implementation"""
         context = AgentContext(
@@ -477,51 +448,37 @@ class TestSecOpsAgent:
         assert decision.approved is True
         assert decision.next_agent == "sre"
 
-    @pytest.mark.asyncio
-    async def test_secops_requires_input_validation(self, config):
-        """Test secops requires input validation"""
-        context = AgentContext(
+    async def test_secops_flags_validation_and_secrets(self, config):
+        """Test secops requires input validation and detects hardcoded secrets"""
+        unvalidated = AgentContext(
             prompt="Implement API", mode="standard", raw_output="API endpoint without validation"
         )
-
-        agent = SecOpsAgent(config)
-        decision = await agent.evaluate(context)
-
-        assert any(
-            "validation" in s.lower() or "sanitize" in s.lower() for s in decision.suggestions
-        )
-
-    @pytest.mark.asyncio
-    async def test_secops_prevents_hardcoded_secrets(self, config):
-        """Test secops detects hardcoded secrets"""
-        context = AgentContext(
+        hardcoded_secret = AgentContext(
             prompt="Configure API",
             mode="standard",
             raw_output='api_key = "hardcoded-secret-key-123"',
         )
 
         agent = SecOpsAgent(config)
-        decision = await agent.evaluate(context)
+        validation_decision, secret_decision = await asyncio.gather(
+            agent.evaluate(unvalidated), agent.evaluate(hardcoded_secret)
+        )
 
-        assert any("env" in s.lower() or "secret" in s.lower() for s in decision.suggestions)
+        validation_blob = _blob(validation_decision)
+        assert "validation" in validation_blob or "sanitize" in validation_blob
+        secret_blob = _blob(secret_decision)
+        assert "env" in secret_blob or "secret" in secret_blob
 
 
 class TestEvaluatorAgent:
     """Test evaluator final review"""
 
-    @pytest.mark.asyncio
-    async def test_evaluator_approval(self, config):
+    async def test_evaluator_approval(self, config, feature_parsed):
         """Test evaluator approves quality implementation"""
         context = AgentContext(
             prompt="Complete feature",
             mode="standard",
-            parsed_response=ParsedResponse(
-                code_blocks=[
-                    CodeBlock(
-                        language="python", content="def feature(): pass", file_path="feature.py"
-                    )
-                ]
-            ),
+            parsed_response=feature_parsed,
             violations=[],
             failures=[],
         )
@@ -532,8 +489,7 @@ class TestEvaluatorAgent:
         assert decision.approved is True
         assert decision.next_agent is None  # Evaluator is always last
 
-    @pytest.mark.asyncio
-    async def test_evaluator_blocks_critical_violations(self, config):
+    async def test_evaluator_blocks_critical_violations(self, config, empty_parsed):
         """Test evaluator blocks on critical violations"""
         context = AgentContext(
             prompt="Feature",
@@ -547,28 +503,25 @@ class TestEvaluatorAgent:
                     suggestion="Use parameterized queries",
                 )
             ],
-            parsed_response=ParsedResponse(code_blocks=[]),
+            parsed_response=empty_parsed,
         )
 
         agent = EvaluatorAgent(config)
         decision = await agent.evaluate(context)
 
         assert decision.approved is False
-        assert any("critical" in s.lower() for s in decision.suggestions)
+        assert "critical" in _blob(decision)
 
 
 # Integration Tests
 
 
+@pytest.mark.xdist_group("agents")
 class TestAgentIntegration:
     """Test full agent chain integration"""
 
-    @pytest.mark.asyncio
-    async def test_full_architecture_chain(self, config):
-        """Test complete architecture → dba → coder → tester → secops chain"""
-        orchestrator = OrchestratorAgent(config)
-        await orchestrator.load_agents()
-
+    async def test_full_architecture_chain(self, mocked_orchestrator):
+        """Test complete architecture → dba → coder → tester chain"""
         context = AgentContext(
             prompt="Design and implement secure user authentication with database",
             mode="standard",
@@ -576,17 +529,7 @@ class TestAgentIntegration:
                 code_blocks=[
                     CodeBlock(
                         language="python",
-                        content="""
-def authenticate(username: str, password: str) -> User:
-    user = db.query("SELECT * FROM users WHERE username = ?", username)
-    if verify_password(password, user.password_hash):
-        return user
-    raise AuthError()
-
-def test_authenticate():
-    user = authenticate("test", "pass")
-    assert user.username == "test"
-                    """,
+                        content=_CHAIN_SNIPPET,
                         file_path="auth.py",
                     )
                 ],
@@ -602,26 +545,35 @@ def test_authenticate():
             """,
         )
 
-        decisions = await orchestrator.orchestrate(context, user_agent="architect")
-
-        # In test environment without registered agents, may return empty list
-        # Test verifies orchestrator handles complex context without crashing
-        assert isinstance(decisions, list)
-
-    @pytest.mark.asyncio
-    async def test_strict_mode_stops_on_failure(self, strict_config):
+        decisions = await mocked_orchestrator.orchestrate(context, task_type="database_design")
+
+        assert [d.agent_name for d in decisions] == [
+            "cold_blooded_architect",
+            "dba",
+            "ruthless_coder",
+            "ruthless_tester",
+        ]
+        assert all(d.approved for d in decisions)
+        for decision in decisions:
+            mocked_orchestrator.agents[decision.agent_name].evaluate.assert_awaited_once_with(
+                context
+            )
+
+    async def test_strict_mode_stops_on_failure(self, mocked_strict_orchestrator):
         """Test strict mode stops orchestration on first failure"""
-        orchestrator = OrchestratorAgent(strict_config)
-        await orchestrator.load_agents()
-
         context = AgentContext(
-            prompt="Vague task",  # Will fail architect
+            prompt="Vague task",  # Rejected by the mocked architect
             mode="strict",
             raw_output="Incomplete design",
         )
 
-        decisions = await orchestrator.orchestrate(context)
+        decisions = await mocked_strict_orchestrator.orchestrate(context, mode="strict")
 
-        # In current implementation, if agents aren't registered, returns empty list
-        # This test verifies orchestrator doesn't crash on bad input
-        assert isinstance(decisions, list)
+        assert len(decisions) == 1
+        assert decisions[0].approved is False
+        # No agent after the rejecting one is evaluated
+        for name, agent in mocked_strict_orchestrator.agents.items():
+            if name == "cold_blooded_architect":
+                agent.evaluate.assert_awaited_once_with(context)
+            else:
+                agent.evaluate.assert_not_awaited()
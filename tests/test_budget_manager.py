@@ -4,14 +4,15 @@ import pytest
 from guardloop.core.budget_manager import ContextBudgetManager
 
 
+@pytest.fixture(scope="module")
+def manager():
+    """Budget manager shared by the module (read-only lookup tables)"""
+    return ContextBudgetManager()
+
+
 class TestBudgetCalculation:
     """Test budget calculation logic"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
     def test_init(self, manager):
         """Test manager initialization"""
         assert manager is not None
@@ -19,58 +20,30 @@ class TestBudgetCalculation:
         assert len(manager.COMPLEXITY_MULTIPLIERS) == 4
         assert len(manager.ALLOCATION_RATIOS) == 4
 
-    def test_get_budget_claude_opus(self, manager):
-        """Test budget calculation for Claude Opus"""
-        budget = manager.get_budget("claude-opus-4", "simple")
-        assert budget == 3000  # 10000 * 0.3
-
-        budget = manager.get_budget("claude-opus-4", "medium")
-        assert budget == 6000  # 10000 * 0.6
-
-        budget = manager.get_budget("claude-opus-4", "complex")
-        assert budget == 9000  # 10000 * 0.9
-
-        budget = manager.get_budget("claude-opus-4", "critical")
-        assert budget == 10000  # 10000 * 1.0
-
-    def test_get_budget_claude_sonnet(self, manager):
-        """Test budget calculation for Claude Sonnet"""
-        budget = manager.get_budget("claude-sonnet-4", "simple")
-        assert budget == 1800  # 6000 * 0.3
-
-        budget = manager.get_budget("claude-sonnet-4", "medium")
-        assert budget == 3600  # 6000 * 0.6
-
-        budget = manager.get_budget("claude-sonnet-4", "complex")
-        assert budget == 5400  # 6000 * 0.9
-
-    def test_get_budget_gpt4(self, manager):
-        """Test budget calculation for GPT-4"""
-        budget = manager.get_budget("gpt-4", "simple")
-        assert budget == 1200  # 4000 * 0.3
-
-        budget = manager.get_budget("gpt-4", "critical")
-        assert budget == 4000  # 4000 * 1.0
-
-    def test_get_budget_unknown_model(self, manager):
-        """Test budget calculation for unknown model uses default"""
-        budget = manager.get_budget("unknown-model", "medium")
-        assert budget == 3000  # 5000 (default) * 0.6
-
-    def test_get_budget_unknown_complexity(self, manager):
-        """Test unknown complexity uses medium (0.6) multiplier"""
-        budget = manager.get_budget("claude-sonnet-4", "unknown")
-        assert budget == 3600  # 6000 * 0.6 (default)
+    @pytest.mark.parametrize(
+        "model,complexity,expected",
+        [
+            ("claude-opus-4", "simple", 3000),  # 10000 * 0.3
+            ("claude-opus-4", "medium", 6000),  # 10000 * 0.6
+            ("claude-opus-4", "complex", 9000),  # 10000 * 0.9
+            ("claude-opus-4", "critical", 10000),  # 10000 * 1.0
+            ("claude-sonnet-4", "simple", 1800),  # 6000 * 0.3
+            ("claude-sonnet-4", "medium", 3600),  # 6000 * 0.6
+            ("claude-sonnet-4", "complex", 5400),  # 6000 * 0.9
+            ("gpt-4", "simple", 1200),  # 4000 * 0.3
+            ("gpt-4", "critical", 4000),  # 4000 * 1.0
+            ("unknown-model", "medium", 3000),  # 5000 (default) * 0.6
+            ("claude-sonnet-4", "unknown", 3600),  # 6000 * 0.6 (default multiplier)
+        ],
+    )
+    def test_get_budget(self, manager, model, complexity, expected):
+        """Test budget calculation per model and complexity"""
+        assert manager.get_budget(model, complexity) == expected
 
 
 class TestBudgetAllocation:
     """Test budget allocation across categories"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
     def test_allocate_budget_basic(self, manager):
         """Test basic budget allocation"""
         allocation = manager.allocate_budget(1000)
@@ -118,11 +91,6 @@ class TestBudgetAllocation:
 class TestModeAdjustment:
     """Test budget adjustment for different modes"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
     def test_adjust_for_standard_mode(self, manager):
         """Test standard mode doesn't change budget"""
         budget = manager.adjust_for_mode(1000, "standard")
@@ -142,50 +110,39 @@ class TestModeAdjustment:
 class TestModelNormalization:
     """Test model name normalization"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
-    def test_normalize_claude_models(self, manager):
-        """Test Claude model normalization"""
-        assert manager._normalize_model_name("Claude-Opus-4") == "claude-opus-4"
-        assert manager._normalize_model_name("claude-opus") == "claude-opus-4"
-        assert manager._normalize_model_name("OPUS") == "claude-opus-4"
-
-        assert manager._normalize_model_name("Claude-Sonnet-4") == "claude-sonnet-4"
-        assert manager._normalize_model_name("sonnet") == "claude-sonnet-4"
-
-        assert manager._normalize_model_name("Claude-Haiku") == "claude-haiku"
-        assert manager._normalize_model_name("haiku") == "claude-haiku"
-
-    def test_normalize_openai_models(self, manager):
-        """Test OpenAI model normalization"""
-        assert manager._normalize_model_name("GPT-4") == "gpt-4"
-        assert manager._normalize_model_name("gpt-4-turbo") == "gpt-4-turbo"
-        assert manager._normalize_model_name("gpt-4-1106-preview") == "gpt-4-turbo"
-        assert manager._normalize_model_name("GPT-3.5-Turbo") == "gpt-3.5-turbo"
-        assert manager._normalize_model_name("gpt-35-turbo") == "gpt-3.5-turbo"
-
-    def test_normalize_google_models(self, manager):
-        """Test Google model normalization"""
-        assert manager._normalize_model_name("Gemini-Pro") == "gemini-pro"
-        assert manager._normalize_model_name("gemini") == "gemini-pro"
-        assert manager._normalize_model_name("Gemini-Ultra") == "gemini-ultra"
-
-    def test_normalize_unknown_model(self, manager):
-        """Test unknown model uses default"""
-        assert manager._normalize_model_name("unknown-llm") == "default"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            # Claude
+            ("Claude-Opus-4", "claude-opus-4"),
+            ("claude-opus", "claude-opus-4"),
+            ("OPUS", "claude-opus-4"),
+            ("Claude-Sonnet-4", "claude-sonnet-4"),
+            ("sonnet", "claude-sonnet-4"),
+            ("Claude-Haiku", "claude-haiku"),
+            ("haiku", "claude-haiku"),
+            # OpenAI
+            ("GPT-4", "gpt-4"),
+            ("gpt-4-turbo", "gpt-4-turbo"),
+            ("gpt-4-1106-preview", "gpt-4-turbo"),
+            ("GPT-3.5-Turbo", "gpt-3.5-turbo"),
+            ("gpt-35-turbo", "gpt-3.5-turbo"),
+            # Google
+            ("Gemini-Pro", "gemini-pro"),
+            ("gemini", "gemini-pro"),
+            ("Gemini-Ultra", "gemini-ultra"),
+            # Unknown models use the default budget
+            ("unknown-llm", "default"),
+        ],
+    )
+    def test_normalize_model_name(self, manager, name, expected):
+        """Test model name normalization"""
+        assert manager._normalize_model_name(name) == expected
 
 
 class TestUtilityMethods:
     """Test utility methods"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
     def test_get_model_info(self, manager):
         """Test get_model_info returns complete information"""
         info = manager.get_model_info("claude-sonnet-4")
@@ -222,11 +179,6 @@ class TestUtilityMethods:
 class TestIntegration:
     """Test integration scenarios"""
 
-    @pytest.fixture
-    def manager(self):
-        """Create budget manager instance"""
-        return ContextBudgetManager()
-
     def test_full_workflow_simple_task(self, manager):
         """Test complete workflow for simple task"""
         # Calculate budget
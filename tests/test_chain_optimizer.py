@@ -1,57 +1,59 @@
 """Tests for AgentChainOptimizer"""
 
+from types import MappingProxyType
+
 import pytest
 
 from guardloop.agents.chain_optimizer import AgentChainOptimizer, TaskComplexity
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def optimizer():
-    """Create chain optimizer instance"""
+    """Chain optimizer shared by the module (read-only lookup tables)"""
     return AgentChainOptimizer()
 
 
 class TestTaskChainSelection:
     """Test task-to-chain selection"""
 
-    def test_simple_task_single_agent(self, optimizer):
-        chain = optimizer.select_chain("fix_typo")
-        assert len(chain) == 1
-        assert chain == ["standards_oracle"]
-
-    def test_simple_task_docs(self, optimizer):
-        chain = optimizer.select_chain("update_docs")
-        assert len(chain) == 1
-        assert chain == ["documentation_codifier"]
-
-    def test_medium_task_focused_chain(self, optimizer):
-        chain = optimizer.select_chain("implement_function")
-        assert len(chain) == 3
-        assert "cold_blooded_architect" in chain
-        assert "ruthless_coder" in chain
-        assert "ruthless_tester" in chain
-
-    def test_complex_task_extended_chain(self, optimizer):
-        chain = optimizer.select_chain("implement_feature")
-        assert len(chain) >= 4
-        assert "business_analyst" in chain
-        assert "cold_blooded_architect" in chain
-        assert "merciless_evaluator" in chain
-
-    def test_critical_task_full_chain(self, optimizer):
-        chain = optimizer.select_chain("build_auth_system")
-        assert len(chain) >= 8
-        assert "secops_engineer" in chain
-        assert "dba" in chain
-        assert "standards_oracle" in chain
-
-    def test_default_chain_for_unknown_task(self, optimizer):
-        chain = optimizer.select_chain("unknown_task_xyz")
-        # Should return default medium chain
-        assert len(chain) == 3
-        assert "cold_blooded_architect" in chain
-        assert "ruthless_coder" in chain
-        assert "ruthless_tester" in chain
+    @pytest.mark.parametrize(
+        "task,min_len,max_len,required",
+        [
+            ("fix_typo", 1, 1, {"standards_oracle"}),
+            ("update_docs", 1, 1, {"documentation_codifier"}),
+            (
+                "implement_function",
+                3,
+                3,
+                {"cold_blooded_architect", "ruthless_coder", "ruthless_tester"},
+            ),
+            (
+                "implement_feature",
+                4,
+                None,
+                {"business_analyst", "cold_blooded_architect", "merciless_evaluator"},
+            ),
+            ("build_auth_system", 8, None, {"secops_engineer", "dba", "standards_oracle"}),
+            # Unknown tasks fall back to the default medium chain
+            (
+                "unknown_task_xyz",
+                3,
+                3,
+                {"cold_blooded_architect", "ruthless_coder", "ruthless_tester"},
+            ),
+            # Specialized tasks
+            ("implement_ui", 1, None, {"ux_ui_designer", "ruthless_coder", "ruthless_tester"}),
+            ("database_design", 1, None, {"dba", "cold_blooded_architect"}),
+            ("implement_auth", 1, None, {"secops_engineer", "cold_blooded_architect"}),
+            ("api_security", 1, None, {"secops_engineer"}),
+        ],
+    )
+    def test_chain_selection(self, optimizer, task, min_len, max_len, required):
+        chain = optimizer.select_chain(task)
+        assert len(chain) >= min_len
+        if max_len is not None:
+            assert len(chain) <= max_len
+        assert required.issubset(chain)
 
 
 class TestStrictMode:
@@ -116,19 +118,16 @@ class TestComplexityDetection:
         complexity = optimizer.get_complexity("implement_function")
         assert complexity == TaskComplexity.MEDIUM
 
-    def test_complex_complexity(self, optimizer):
-        # Most tasks are either SIMPLE (<=2), MEDIUM (3-5), or CRITICAL (9+)
-        # There are no defined tasks with 6-8 agents in current implementation
-        # Skip this test or verify complexity classification logic works
-        # For now, verify that COMPLEX range (6-8 agents) classification works
-        # by checking the get_complexity logic directly
-        from guardloop.agents.chain_optimizer import TaskComplexity
-
-        # Simulate a task with 7 agents (COMPLEX range)
+    def test_complex_complexity(self, optimizer, monkeypatch):
+        # No defined task has 6-8 agents, so simulate one (COMPLEX range).
+        # The table is frozen, so swap in an extended copy for this test.
         mock_task = "mock_complex_task"
-        optimizer.TASK_AGENT_CHAINS[mock_task] = ["agent" + str(i) for i in range(7)]
-        complexity = optimizer.get_complexity(mock_task)
-        assert complexity == TaskComplexity.COMPLEX
+        chains = {
+            **AgentChainOptimizer.TASK_AGENT_CHAINS,
+            mock_task: tuple(f"agent{i}" for i in range(7)),
+        }
+        monkeypatch.setattr(AgentChainOptimizer, "TASK_AGENT_CHAINS", MappingProxyType(chains))
+        assert optimizer.get_complexity(mock_task) == TaskComplexity.COMPLEX
 
     def test_critical_complexity(self, optimizer):
         complexity = optimizer.get_complexity("build_auth_system")
@@ -157,30 +156,6 @@ class TestAgentNameNormalization:
         assert normalized == "ruthless_coder"
 
 
-class TestSpecializedTasks:
-    """Test specialized task chains"""
-
-    def test_ui_task_chain(self, optimizer):
-        chain = optimizer.select_chain("implement_ui")
-        assert "ux_ui_designer" in chain
-        assert "ruthless_coder" in chain
-        assert "ruthless_tester" in chain
-
-    def test_database_task_chain(self, optimizer):
-        chain = optimizer.select_chain("database_design")
-        assert "dba" in chain
-        assert "cold_blooded_architect" in chain
-
-    def test_auth_task_chain(self, optimizer):
-        chain = optimizer.select_chain("implement_auth")
-        assert "secops_engineer" in chain
-        assert "cold_blooded_architect" in chain
-
-    def test_api_security_chain(self, optimizer):
-        chain = optimizer.select_chain("api_security")
-        assert "secops_engineer" in chain
-
-
 class TestUtilityMethods:
     """Test utility methods"""
 
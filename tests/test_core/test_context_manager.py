@@ -1,9 +1,19 @@
 """Unit tests for ContextManager"""
 
-import pytest
+import re
 from pathlib import Path
+from types import SimpleNamespace
+
+from guardloop.core import context_manager
 from guardloop.core.context_manager import ContextManager, GuardrailCache
 
+# Mode tag sits inside the guardrails block, the user request follows it
+_CONTEXT_LAYOUT = re.compile(
+    r"<guardrails>.*<mode>standard</mode>.*</guardrails>"
+    r".*<user_request>.*Test prompt.*</user_request>",
+    re.DOTALL,
+)
+
 
 class TestGuardrailCache:
     """Test GuardrailCache functionality"""
@@ -15,9 +25,11 @@ class TestGuardrailCache:
 
         assert cache.get("test_key") == "test_value"
 
-    def test_cache_expiration(self):
+    def test_cache_expiration(self, monkeypatch):
         """Test cache TTL expiration"""
-        import time
+        # Drive the cache from a fake clock instead of sleeping past the TTL
+        now = [1000.0]
+        monkeypatch.setattr(context_manager, "time", SimpleNamespace(monotonic=lambda: now[0]))
 
         cache = GuardrailCache(ttl_seconds=1)
         cache.set("test_key", "test_value")
@@ -26,7 +38,7 @@ class TestGuardrailCache:
         assert cache.get("test_key") == "test_value"
 
         # After TTL should expire
-        time.sleep(1.1)
+        now[0] += 1.1
         assert cache.get("test_key") is None
 
     def test_cache_invalidate(self):
@@ -86,12 +98,7 @@ class TestContextManager:
 
         context = cm.build_context("Test prompt", agent="architect", mode="standard")
 
-        assert "<guardrails>" in context
-        assert "</guardrails>" in context
-        assert "<user_request>" in context
-        assert "</user_request>" in context
-        assert "Test prompt" in context
-        assert "<mode>standard</mode>" in context
+        assert _CONTEXT_LAYOUT.search(context) is not None
 
     def test_mode_instructions(self):
         """Test mode-specific instructions"""
@@ -126,11 +133,10 @@ class TestContextManager:
         assert stats["available_agents"] == 13
 
 
-@pytest.mark.asyncio
-class TestContextManagerAsync:
-    """Test async ContextManager functionality"""
+class TestContextManagerCache:
+    """Test ContextManager guardrail caching"""
 
-    async def test_cache_refresh(self):
+    def test_cache_refresh(self):
         """Test cache refresh functionality"""
         cm = ContextManager(cache_ttl=1)
 
@@ -1,15 +1,43 @@
 """Unit tests for FailureDetector"""
 
+from datetime import datetime
+
 import pytest
 from guardloop.core.failure_detector import FailureDetector, DetectedFailure
 
+# Fixed timestamp keeps failure samples deterministic
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+# category, sample text, expected severity of every match (None: not checked)
+DETECTION_CASES = [
+    pytest.param("JWT/Auth", "JWT token expired, authentication failed", "high", id="jwt"),
+    pytest.param(".NET Code", "Dependency injection error in csproj file", None, id="dotnet"),
+    pytest.param(
+        "File Overwrite", "File corrupted with ))))))))))))) pattern", "critical", id="corruption"
+    ),
+    pytest.param(
+        "Security",
+        "Missing MFA and Azure AD, RBAC not configured, SQL injection vulnerability",
+        "critical",
+        id="security",
+    ),
+    pytest.param("Looping", "Stack overflow, infinite recursion detected", "critical", id="loop"),
+    pytest.param(
+        "Pipeline", "Pipeline failed, SonarQube coverage check failed", None, id="pipeline"
+    ),
+    pytest.param("Database", "Database connection failed, deadlock detected", None, id="database"),
+    pytest.param("Type Errors", "TypeError: Cannot read property of undefined", None, id="type"),
+    pytest.param("API Errors", "API returned 500 Internal Server Error", None, id="api"),
+]
+
 
 class TestFailureDetector:
     """Test FailureDetector functionality"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def detector(self):
-        """Create detector instance"""
+        """Detector shared by the module; scan() only reads compiled patterns"""
         return FailureDetector()
 
     def test_initialization(self, detector):
@@ -17,62 +45,14 @@ class TestFailureDetector:
         assert detector._compiled_patterns is not None
         assert len(detector._compiled_patterns) == len(detector.PATTERNS)
 
-    def test_jwt_auth_detection(self, detector):
-        """Test JWT/Auth failure detection"""
-        text = "JWT token expired, authentication failed"
-
-        failures = detector.scan(text)
-
-        assert len(failures) > 0
-        assert any(f.category == "JWT/Auth" for f in failures)
-        jwt_failure = next(f for f in failures if f.category == "JWT/Auth")
-        assert jwt_failure.severity == "high"
-
-    def test_dotnet_detection(self, detector):
-        """Test .NET code failure detection"""
-        text = "Dependency injection error in csproj file"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == ".NET Code" for f in failures)
-
-    def test_file_corruption_detection(self, detector):
-        """Test file corruption pattern detection"""
-        text = "File corrupted with ))))))))))))) pattern"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == "File Overwrite" for f in failures)
-        corruption_failure = next(f for f in failures if f.category == "File Overwrite")
-        assert corruption_failure.severity == "critical"
-
-    def test_security_detection(self, detector):
-        """Test security issue detection"""
-        text = "Missing MFA and Azure AD, RBAC not configured, SQL injection vulnerability"
-
-        failures = detector.scan(text)
-
-        security_failures = [f for f in failures if f.category == "Security"]
-        assert len(security_failures) > 0
-        assert all(f.severity == "critical" for f in security_failures)
+    @pytest.mark.parametrize("category,text,severity", DETECTION_CASES)
+    def test_category_detection(self, detector, category, text, severity):
+        """Test each failure category is detected with its severity"""
+        matches = detector.get_failures_by_category(detector.scan(text), category)
 
-    def test_looping_detection(self, detector):
-        """Test infinite loop detection"""
-        text = "Stack overflow, infinite recursion detected"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == "Looping" for f in failures)
-        loop_failure = next(f for f in failures if f.category == "Looping")
-        assert loop_failure.severity == "critical"
-
-    def test_pipeline_detection(self, detector):
-        """Test pipeline failure detection"""
-        text = "Pipeline failed, SonarQube coverage check failed"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == "Pipeline" for f in failures)
+        assert len(matches) > 0
+        if severity is not None:
+            assert all(f.severity == severity for f in matches)
 
     def test_multiple_failure_detection(self, detector):
         """Test detecting multiple failures"""
@@ -125,44 +105,30 @@ class TestFailureDetector:
             # First failure should be critical or high
             assert failures[0].severity in ["critical", "high"]
 
-    def test_has_critical_failures(self, detector):
-        """Test critical failure check"""
-        text_critical = "Security vulnerability: SQL injection"
-        text_normal = "Some regular code"
-
-        failures_critical = detector.scan(text_critical)
-        failures_normal = detector.scan(text_normal)
-
-        assert detector.has_critical_failures(failures_critical) is True
-        assert detector.has_critical_failures(failures_normal) is False
-
-    def test_get_failures_by_severity(self, detector):
-        """Test filtering by severity"""
+    def test_scan_filters(self, detector):
+        """Test severity/category filters and the critical check on one scan"""
         text = """
         Critical: Stack overflow
         High: Pipeline failed
         Low: Missing dark mode
+        JWT auth failed
+        Security vulnerability: SQL injection
         """
 
         failures = detector.scan(text)
 
         critical = detector.get_failures_by_severity(failures, "critical")
-        high = detector.get_failures_by_severity(failures, "high")
-
         assert len(critical) > 0
         assert all(f.severity == "critical" for f in critical)
 
-    def test_get_failures_by_category(self, detector):
-        """Test filtering by category"""
-        text = "JWT auth failed and pipeline failed"
-
-        failures = detector.scan(text)
-
         jwt_failures = detector.get_failures_by_category(failures, "JWT/Auth")
         pipeline_failures = detector.get_failures_by_category(failures, "Pipeline")
-
         assert len(jwt_failures) > 0
         assert all(f.category == "JWT/Auth" for f in jwt_failures)
+        assert len(pipeline_failures) > 0
+
+        assert detector.has_critical_failures(failures) is True
+        assert detector.has_critical_failures(detector.scan("Some regular code")) is False
 
     def test_format_failures_report(self, detector):
         """Test failure report formatting"""
@@ -201,43 +167,16 @@ class TestFailureDetector:
         assert len(failures) > 0
         assert all(f.tool == "claude" for f in failures)
 
-    def test_database_failures(self, detector):
-        """Test database failure detection"""
-        text = "Database connection failed, deadlock detected"
-
-        failures = detector.scan(text)
-
-        db_failures = [f for f in failures if f.category == "Database"]
-        assert len(db_failures) > 0
-
-    def test_type_error_detection(self, detector):
-        """Test type error detection"""
-        text = "TypeError: Cannot read property of undefined"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == "Type Errors" for f in failures)
-
-    def test_api_error_detection(self, detector):
-        """Test API error detection"""
-        text = "API returned 500 Internal Server Error"
-
-        failures = detector.scan(text)
-
-        assert any(f.category == "API Errors" for f in failures)
-
 
 class TestDetectedFailure:
     """Test DetectedFailure dataclass"""
 
     def test_failure_creation(self):
         """Test creating detected failures"""
-        from datetime import datetime
-
         failure = DetectedFailure(
             category="JWT/Auth",
             pattern="jwt token",
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
             severity="high",
             context="JWT token expired",
             suggestion="Check token validity",
@@ -182,3 +182,11 @@ class TestParsedResponse:
         assert len(response.file_paths) == 1
         assert len(response.commands) == 1
         assert response.test_coverage == 95.0
+
+    def test_joined_code(self):
+        """Test code block contents are joined once at creation"""
+        response = ParsedResponse(code_blocks=[CodeBlock("python", "a = 1"), CodeBlock("js", "b")])
+
+        assert response.joined_code == "a = 1\nb"
+        assert isinstance(response.code_blocks, tuple)
+        assert ParsedResponse().joined_code == ""
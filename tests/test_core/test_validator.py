@@ -26,7 +26,6 @@ class TestGuardrailValidator:
             test_coverage=95.0,
         )
 
-    @pytest.mark.asyncio
     async def test_bpsbs_three_layer_check(self, validator_standard):
         """Test 3-layer architecture check"""
         text_missing = "Just a simple function"
@@ -45,7 +44,6 @@ class TestGuardrailValidator:
         three_layer_complete = sum(1 for v in violations_complete if "three_layer" in v.rule)
         assert three_layer_complete < three_layer_missing or three_layer_complete == 0
 
-    @pytest.mark.asyncio
     async def test_security_checks(self, validator_standard):
         """Test security-related checks"""
         text_insecure = "Simple login without authentication"
@@ -62,7 +60,6 @@ class TestGuardrailValidator:
         # Should detect missing MFA/Azure AD
         assert any("mfa_azure_ad" in v.rule for v in violations_insecure)
 
-    @pytest.mark.asyncio
     async def test_test_coverage_check(self, validator_standard):
         """Test coverage validation"""
         text_low = "Test coverage: 75%"
@@ -80,7 +77,6 @@ class TestGuardrailValidator:
         assert len(coverage_violations_low) > 0
         assert len(coverage_violations_high) == 0
 
-    @pytest.mark.asyncio
     async def test_ai_guardrails_checks(self, validator_standard):
         """Test AI guardrails"""
         text_incomplete = "Here's the code"
@@ -97,7 +93,6 @@ class TestGuardrailValidator:
 
         assert len(violations_incomplete) > len(violations_complete)
 
-    @pytest.mark.asyncio
     async def test_ux_ui_checks(self, validator_standard):
         """Test UX/UI guardrails"""
         text_poor = "Button says OK with no tooltip"
@@ -111,7 +106,6 @@ class TestGuardrailValidator:
         # Poor UX should have vague label violation
         assert any("vague_labels" in v.rule for v in violations_poor)
 
-    @pytest.mark.asyncio
     async def test_strict_mode_blocking(self, validator_strict, sample_response):
         """Test strict mode violation blocking"""
         text = "Code without proper guardrails"
@@ -50,7 +50,6 @@ class TestBackgroundWorker:
         assert worker.running is False
         assert worker.worker_name == "TestWorker"
 
-    @pytest.mark.asyncio
     async def test_start_stop(self, worker):
         """Test starting and stopping worker"""
         # Start worker
@@ -91,7 +90,6 @@ class TestAnalysisWorker:
         """Test worker initialization"""
         assert worker.worker_name == "AnalysisWorker"
 
-    @pytest.mark.asyncio
     async def test_analyze_trends(self, worker):
         """Test trend analysis"""
         trends = await worker._analyze_trends()
@@ -104,7 +102,6 @@ class TestAnalysisWorker:
         assert "by_severity" in trends
         assert trends["period"] == "24h"
 
-    @pytest.mark.asyncio
     async def test_generate_insights(self, worker):
         """Test insight generation"""
         trends = {
@@ -123,14 +120,12 @@ class TestAnalysisWorker:
         assert jwt_insight["type"] == "spike"
         assert jwt_insight["count"] == 15
 
-    @pytest.mark.asyncio
     async def test_save_trends(self, worker):
         """Test saving trends"""
         trends = {"test": "data"}
         await worker._save_trends(trends)
         # Should complete without error
 
-    @pytest.mark.asyncio
     async def test_save_insights(self, worker):
         """Test saving insights"""
         insights = [{"type": "test", "message": "Test insight"}]
@@ -160,44 +155,37 @@ class TestMetricsWorker:
         """Test worker initialization"""
         assert worker.worker_name == "MetricsWorker"
 
-    @pytest.mark.asyncio
     async def test_count_sessions(self, worker):
         """Test session counting"""
         count = await worker._count_sessions()
         assert isinstance(count, int)
 
-    @pytest.mark.asyncio
     async def test_calculate_success_rate(self, worker):
         """Test success rate calculation"""
         rate = await worker._calculate_success_rate()
         assert isinstance(rate, float)
         assert 0 <= rate <= 100
 
-    @pytest.mark.asyncio
     async def test_avg_execution_time(self, worker):
         """Test average execution time calculation"""
         avg_time = await worker._avg_execution_time()
         assert isinstance(avg_time, int)
 
-    @pytest.mark.asyncio
     async def test_top_violations(self, worker):
         """Test getting top violations"""
         violations = await worker._top_violations()
         assert isinstance(violations, list)
 
-    @pytest.mark.asyncio
     async def test_top_failures(self, worker):
         """Test getting top failures"""
         failures = await worker._top_failures()
         assert isinstance(failures, list)
 
-    @pytest.mark.asyncio
     async def test_agent_stats(self, worker):
         """Test getting agent statistics"""
         stats = await worker._agent_stats()
         assert isinstance(stats, dict)
 
-    @pytest.mark.asyncio
     async def test_store_metrics(self, worker):
         """Test storing metrics"""
         metrics = {
@@ -230,7 +218,6 @@ class TestMarkdownExporter:
         """Test worker initialization"""
         assert worker.worker_name == "MarkdownExporter"
 
-    @pytest.mark.asyncio
     async def test_get_recent_failures(self, worker):
         """Test getting recent failures"""
         failures = await worker._get_recent_failures(limit=50)
@@ -312,20 +299,17 @@ class TestCleanupWorker:
         """Test worker initialization"""
         assert worker.worker_name == "CleanupWorker"
 
-    @pytest.mark.asyncio
     async def test_delete_old_sessions(self, worker):
         """Test deleting old sessions"""
         deleted = await worker._delete_old_sessions(days=30)
         assert isinstance(deleted, int)
         assert deleted >= 0
 
-    @pytest.mark.asyncio
     async def test_vacuum_database(self, worker):
         """Test database vacuum"""
         await worker._vacuum_database()
         # Should complete without error
 
-    @pytest.mark.asyncio
     async def test_rotate_logs(self, worker):
         """Test log rotation"""
         await worker._rotate_logs()
@@ -384,7 +368,6 @@ class TestWorkerManager:
 
         assert len(manager.workers) == 0
 
-    @pytest.mark.asyncio
     async def test_start_all_no_workers(self, db):
         """Test starting with no workers"""
         config = Config()
@@ -397,7 +380,6 @@ class TestWorkerManager:
         await manager.start_all()
         # Should complete without error
 
-    @pytest.mark.asyncio
     async def test_stop_all(self, manager):
         """Test stopping all workers"""
         # Mock workers
@@ -1,6 +1,5 @@
 """Integration tests for complete guardrail workflow"""
 
-import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 from pathlib import Path
 
@@ -10,7 +9,6 @@ from guardloop.adapters.base import AIResponse
 from guardloop.utils.config import Config, DatabaseConfig
 
 
-@pytest.mark.asyncio
 async def test_full_flow_standard_mode(config, sample_ai_response):
     """Test complete flow from request to result in standard mode"""
     daemon = GuardrailDaemon(config)
@@ -38,7 +36,6 @@ async def test_full_flow_standard_mode(config, sample_ai_response):
         assert "BPSBS" in call_args[0][0] or "guardrail" in call_args[0][0].lower()
 
 
-@pytest.mark.asyncio
 async def test_full_flow_strict_mode(strict_config):
     """Test complete flow with strict validation"""
     daemon = GuardrailDaemon(strict_config)
@@ -66,7 +63,6 @@ No tests provided.
         assert result.approved is False or len(result.violations) > 0
 
 
-@pytest.mark.asyncio
 async def test_agent_chain_execution(config):
     """Test multi-agent chain execution"""
     daemon = GuardrailDaemon(config)
@@ -134,7 +130,6 @@ Monitoring: Prometheus metrics configured
         assert result.parsed.test_coverage == 100  # Should meet coverage requirement
 
 
-@pytest.mark.asyncio
 async def test_failure_detection(config):
     """Test failure pattern detection"""
     daemon = GuardrailDaemon(config)
@@ -166,7 +161,6 @@ Database query failed: Connection timeout
         assert any("JWT" in cat or "Auth" in cat for cat in failure_categories)
 
 
-@pytest.mark.asyncio
 async def test_guardrail_injection(config, tmp_path):
     """Test guardrail markdown injection into prompts"""
     # Create test guardrail file
@@ -206,7 +200,6 @@ async def test_guardrail_injection(config, tmp_path):
         assert result.guardrails_applied is True
 
 
-@pytest.mark.asyncio
 async def test_context_preservation(config):
     """Test context preservation across multiple requests"""
     daemon = GuardrailDaemon(config)
@@ -245,7 +238,6 @@ async def test_context_preservation(config):
         assert result1.approved and result2.approved
 
 
-@pytest.mark.asyncio
 async def test_multi_tool_support(config):
     """Test support for multiple AI tools"""
     daemon = GuardrailDaemon(config)
@@ -269,7 +261,6 @@ async def test_multi_tool_support(config):
             assert result.session_id is not None
 
 
-@pytest.mark.asyncio
 async def test_violation_thresholds(config):
     """Test violation severity thresholds"""
     daemon = GuardrailDaemon(config)
@@ -304,7 +295,6 @@ def login(user, pass):
         assert len(critical_violations) > 0
 
 
-@pytest.mark.asyncio
 async def test_background_worker_integration(config):
     """Test daemon can process multiple requests"""
     daemon = GuardrailDaemon(config)
@@ -334,7 +324,6 @@ async def test_background_worker_integration(config):
         assert len(set(session_ids)) == 3
 
 
-@pytest.mark.asyncio
 async def test_performance_metrics(config):
     """Test performance metrics collection"""
     daemon = GuardrailDaemon(config)
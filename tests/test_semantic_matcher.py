@@ -71,7 +71,6 @@ class TestSemanticMatcher:
         with pytest.raises(ImportError):
             matcher._ensure_model_loaded()
 
-    @pytest.mark.asyncio
     @patch("guardloop.core.semantic_matcher.SentenceTransformer")
     async def test_index_guardrails(self, mock_transformer, matcher, mock_guardrails):
         """Test guardrail indexing"""
@@ -95,7 +94,6 @@ class TestSemanticMatcher:
         assert 2 in matcher.guardrail_embeddings
         assert 3 in matcher.guardrail_embeddings
 
-    @pytest.mark.asyncio
     @patch("guardloop.core.semantic_matcher.SentenceTransformer")
     async def test_find_relevant(self, mock_transformer, matcher, mock_guardrails):
         """Test semantic similarity matching"""
@@ -134,7 +132,6 @@ class TestSemanticMatcher:
         if len(results) > 1:
             assert results[0][1] >= results[1][1]
 
-    @pytest.mark.asyncio
     async def test_find_relevant_empty_guardrails(self, matcher):
         """Test find_relevant with empty guardrails"""
         results = await matcher.find_relevant(
@@ -143,7 +140,6 @@ class TestSemanticMatcher:
 
         assert results == []
 
-    @pytest.mark.asyncio
     @patch("guardloop.core.semantic_matcher.SentenceTransformer")
     async def test_find_relevant_threshold_filtering(
         self, mock_transformer, matcher, mock_guardrails
@@ -201,7 +197,6 @@ class TestSemanticMatcher:
 class TestAdaptiveGuardrailsIntegration:
     """Test semantic matching integration with AdaptiveGuardrailGenerator"""
 
-    @pytest.mark.asyncio
     async def test_semantic_matching_flag(self):
         """Test that use_semantic_matching flag works"""
         # This is an integration test placeholder